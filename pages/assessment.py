@@ -0,0 +1,367 @@
+"""Ethical Assessment Checklist page."""
+
+import zlib
+from datetime import datetime
+from types import MappingProxyType
+
+import streamlit as st
+import numpy as np
+import orjson
+import pandas as pd
+import pyarrow as pa
+
+import plotly.express as px
+
+# Checklist content is fixed: eight sections of eight weighted items. Built
+# once at import and wrapped read-only so the ~64 item tuples are not
+# reallocated on every rerun.
+_ASSESSMENT_SECTIONS = MappingProxyType({
+    "1. Fairness & Non-Discrimination": {
+        "description": "Ensure the AI system does not discriminate against protected groups",
+        "items": (
+            ("1.1", "Protected characteristics (race, gender, age, etc.) are not used as direct inputs", "Critical"),
+            ("1.2", "Proxy variables have been analyzed for correlation with protected characteristics", "Critical"),
+            ("1.3", "Training data has been assessed for representation bias", "Critical"),
+            ("1.4", "Disparate impact testing has been conducted", "Critical"),
+            ("1.5", "Fairness metrics (demographic parity, equal opportunity) are monitored", "High"),
+            ("1.6", "Adverse impact remediation procedures are documented", "High"),
+            ("1.7", "Human override is available for edge cases", "High"),
+            ("1.8", "Regular fairness audits are scheduled (at least annually)", "Medium")
+        )
+    },
+    "2. Transparency & Explainability": {
+        "description": "Ensure decisions can be explained and understood",
+        "items": (
+            ("2.1", "Individual decisions can be explained to affected consumers", "Critical"),
+            ("2.2", "Adverse action notices include specific, accurate reasons", "Critical"),
+            ("2.3", "Model logic and key features are documented", "High"),
+            ("2.4", "Explainability tools (LIME, SHAP) are implemented where appropriate", "High"),
+            ("2.5", "Consumer-friendly explanations are available", "High"),
+            ("2.6", "Regulators can audit the decision-making process", "Critical"),
+            ("2.7", "Model limitations are documented and communicated", "Medium"),
+            ("2.8", "Technical documentation meets EU AI Act standards (if applicable)", "High")
+        )
+    },
+    "3. Accountability & Governance": {
+        "description": "Establish clear lines of responsibility",
+        "items": (
+            ("3.1", "A senior manager is designated as accountable for the AI system", "Critical"),
+            ("3.2", "Roles and responsibilities are clearly defined and documented", "High"),
+            ("3.3", "Escalation procedures for AI issues are established", "High"),
+            ("3.4", "An AI ethics/governance committee reviews high-risk systems", "Medium"),
+            ("3.5", "Third-party AI providers are subject to due diligence", "High"),
+            ("3.6", "Contracts with AI vendors include appropriate liability provisions", "Medium"),
+            ("3.7", "Regular board/executive reporting on AI risks is in place", "Medium"),
+            ("3.8", "Audit trails capture all AI decisions and can be retrieved", "Critical")
+        )
+    },
+    "4. Data Quality & Privacy": {
+        "description": "Ensure data is accurate, relevant, and protected",
+        "items": (
+            ("4.1", "Personal data is collected with appropriate legal basis/consent", "Critical"),
+            ("4.2", "Data minimization principles are applied", "High"),
+            ("4.3", "Training data quality has been validated", "High"),
+            ("4.4", "Data sources are documented and vetted", "High"),
+            ("4.5", "Data retention policies are defined and enforced", "High"),
+            ("4.6", "Data subject rights (access, deletion) can be fulfilled", "Critical"),
+            ("4.7", "Privacy impact assessment has been conducted", "High"),
+            ("4.8", "Cross-border data transfer requirements are met", "High")
+        )
+    },
+    "5. Security & Robustness": {
+        "description": "Ensure the AI system is secure and reliable",
+        "items": (
+            ("5.1", "The AI system has been tested for adversarial attacks", "High"),
+            ("5.2", "Input validation and anomaly detection are implemented", "High"),
+            ("5.3", "Model drift monitoring is in place", "High"),
+            ("5.4", "Cybersecurity measures are appropriate for data sensitivity", "Critical"),
+            ("5.5", "Disaster recovery/business continuity plans include AI systems", "High"),
+            ("5.6", "Access controls limit who can modify the AI system", "High"),
+            ("5.7", "Model versioning and rollback capabilities exist", "Medium"),
+            ("5.8", "Stress testing under extreme conditions has been performed", "Medium")
+        )
+    },
+    "6. Human Oversight": {
+        "description": "Maintain appropriate human control over AI decisions",
+        "items": (
+            ("6.1", "Human review is required for high-stakes decisions", "Critical"),
+            ("6.2", "Staff can understand and challenge AI recommendations", "High"),
+            ("6.3", "Override mechanisms are available and documented", "High"),
+            ("6.4", "Staff receive training on AI system use and limitations", "High"),
+            ("6.5", "Escalation paths for uncertain cases are defined", "Medium"),
+            ("6.6", "Human reviewers have sufficient time and information", "Medium"),
+            ("6.7", "Override decisions are logged and analyzed", "Medium"),
+            ("6.8", "Alert thresholds trigger human review appropriately", "High")
+        )
+    },
+    "7. Consumer Protection": {
+        "description": "Protect consumer rights and interests",
+        "items": (
+            ("7.1", "Consumers are informed when AI is used in decisions affecting them", "High"),
+            ("7.2", "Complaint and appeal procedures are accessible", "Critical"),
+            ("7.3", "Vulnerable consumers are identified and protected", "High"),
+            ("7.4", "AI-driven products meet genuine customer needs", "High"),
+            ("7.5", "Pricing decisions are fair and non-exploitative", "High"),
+            ("7.6", "Marketing personalization respects consumer preferences", "Medium"),
+            ("7.7", "Consumer support can address AI-related queries", "High"),
+            ("7.8", "Redress mechanisms are available for AI errors", "Critical")
+        )
+    },
+    "8. Regulatory Compliance": {
+        "description": "Meet all applicable regulatory requirements",
+        "items": (
+            ("8.1", "All applicable regulations have been identified and mapped", "Critical"),
+            ("8.2", "EU AI Act classification and requirements are addressed (if applicable)", "Critical"),
+            ("8.3", "Fair lending/ECOA requirements are met (if applicable)", "Critical"),
+            ("8.4", "Sector-specific regulations are addressed", "High"),
+            ("8.5", "Regulatory change monitoring process is in place", "High"),
+            ("8.6", "Regulatory reporting capabilities are established", "High"),
+            ("8.7", "Regulatory sandbox participation considered (if appropriate)", "Low"),
+            ("8.8", "Legal review of AI system compliance has been conducted", "High")
+        )
+    }
+})
+
+_PRIORITY_WEIGHTS = MappingProxyType({"Critical": 3, "High": 2, "Medium": 1, "Low": 0.5})
+
+_STATUS_OPTIONS = ("Not Assessed", "Compliant", "Partial", "Non-Compliant", "N/A")
+_PRIORITY_ORDER = ("Critical", "High", "Medium", "Low")
+
+# Readiness thresholds walked highest-first, and the shared card template
+# for the report's summary row.
+_SECTION_TAB_LABELS = tuple(section.split(". ")[1] for section in _ASSESSMENT_SECTIONS)
+
+_READINESS_LUT = (
+    (80.0, "Ready for Production", "#38a169"),
+    (60.0, "Needs Improvement", "#dd6b20"),
+    (0.0, "Not Ready", "#c53030"),
+)
+
+_METRIC_CARD = (
+    '<div class="metric-container">'
+    '<h2 style="color: {color}; margin: 0;">{value}</h2>'
+    '<p style="color: #718096; margin: 0;">{label}</p></div>'
+)
+
+# Static page chrome, allocated once at import.
+_INTRO_HTML = """
+<h1 class="main-header">✅ Ethical Assessment Checklist</h1>
+<div class="info-card">
+    <p>Complete this comprehensive checklist to assess the ethical readiness of your AI system. 
+    This checklist is aligned with major regulatory frameworks including the EU AI Act, 
+    NIST AI RMF, UK FCA guidance, and Singapore MAS FEAT principles.</p>
+</div>
+"""
+
+_ALL_COMPLIANT_HTML = """
+<div class="success-card">
+    <p>✅ No items requiring immediate attention. All assessed items are compliant.</p>
+</div>
+"""
+
+_NOT_ASSESSED_HTML = """
+<div class="warning-card">
+    <p>⚠️ No items have been assessed yet. Set a status on the checklist items above,
+    then generate the report again.</p>
+</div>
+"""
+_STATUS_INDEX = MappingProxyType({status: i for i, status in enumerate(_STATUS_OPTIONS)})
+
+# Credit per status code, indexed by _STATUS_INDEX; N/A items are excluded
+# from the denominator via the code != 4 mask rather than credited.
+_CREDIT_FACTORS = np.array([0.0, 1.0, 0.5, 0.0, 0.0])
+
+# Item weights as a (sections x items) matrix; every section carries the
+# same item count, so flat status codes reshape straight onto it.
+_WEIGHT_MATRIX = np.array(
+    [[_PRIORITY_WEIGHTS[p] for _, _, p in content["items"]] for content in _ASSESSMENT_SECTIONS.values()],
+    dtype=np.float64,
+)
+
+@st.cache_data(max_entries=8)
+def _score_chart(scores_tuple):
+    """Compliance bar chart, cached on the (section, score) pairs so
+    regenerating the report with unchanged statuses reuses the figure."""
+    sections = [section.split(". ")[1] for section, _ in scores_tuple]
+    values = [score for _, score in scores_tuple]
+    fig = px.bar(
+        x=sections,
+        y=values,
+        color=values,
+        color_continuous_scale=["#c53030", "#dd6b20", "#38a169"],
+        title="Compliance Score by Section",
+        labels={"x": "Section", "y": "Score", "color": "Score"},
+    )
+    fig.update_layout(xaxis_tickangle=-45, showlegend=False)
+    fig.update_coloraxes(showscale=False)
+    return fig
+
+
+@st.cache_data(max_entries=8)
+def _section_df(section: str) -> pd.DataFrame:
+    """Initial checklist table for one section's data editor, built once."""
+    items = _ASSESSMENT_SECTIONS[section]["items"]
+    df = pd.DataFrame(items, columns=["ID", "Item", "Priority"]).assign(Status="Not Assessed")
+    # Ordered categorical so severity sorts without a per-row key callback.
+    df["Priority"] = pd.Categorical(df["Priority"], categories=_PRIORITY_ORDER, ordered=True)
+    return df
+
+
+@st.fragment
+def _render() -> None:
+    """Render the Ethical Assessment Checklist page."""
+    # Header and intro card emitted as one element to keep the delta count down.
+    st.markdown(_INTRO_HTML, unsafe_allow_html=True)
+
+    # One form around the inputs and all eight checklist sections: each of
+    # the ~64 status selectboxes used to trigger a full rerun per change;
+    # with the form, edits are held client-side and the script reruns once
+    # on submit.
+    with st.form("assessment_form"):
+        # System Information
+        st.markdown("### 📝 System Information")
+
+        sys_col1, sys_col2 = st.columns(2)
+
+        with sys_col1:
+            system_name = st.text_input("AI System Name:", placeholder="e.g., Credit Decision Engine v2.0")
+            system_owner = st.text_input("System Owner:", placeholder="Name and department")
+
+        with sys_col2:
+            # Default frozen per session: a live datetime.now() default would
+            # differ on every rerun and fight the widget's stored state.
+            assessment_date = st.date_input(
+                "Assessment Date:",
+                value=st.session_state.setdefault("_assessment_date_default", datetime.now().date()),
+                key="assessment_date",
+            )
+            assessor_name = st.text_input("Assessor:", placeholder="Your name")
+
+        st.markdown("---")
+
+
+        # Assessment Form. Tabs instead of eight stacked expanders: the
+        # frontend mounts only the visible panel's grid, and the section
+        # headers double as navigation.
+        section_frames = []
+        section_tabs = st.tabs(_SECTION_TAB_LABELS)
+
+        for tab, (section, content) in zip(section_tabs, _ASSESSMENT_SECTIONS.items()):
+            with tab:
+                st.markdown(f"*{content['description']}*")
+
+                # One data editor per section instead of eight selectboxes:
+                # the whole section is a single widget round-trip.
+                edited = st.data_editor(
+                    _section_df(section),
+                    column_config={
+                        "Item": st.column_config.TextColumn(width="large"),
+                        "Status": st.column_config.SelectboxColumn(options=list(_STATUS_OPTIONS), required=True),
+                    },
+                    disabled=["ID", "Item", "Priority"],
+                    hide_index=True,
+                    use_container_width=True,
+                    key=f"section_editor_{section}",
+                )
+
+                section_frames.append(edited.assign(Section=section))
+
+        st.markdown("---")
+
+        submitted = st.form_submit_button("📊 Generate Assessment Report", type="primary")
+
+    # Generate Assessment Report
+    if submitted:
+        st.markdown("### 📊 Assessment Results")
+
+        # One flat table of all 64 items is the source of truth for the
+        # report: scores, the critical-issue count, and the attention list
+        # all read from it in vectorized passes.
+        flat_df = pd.concat(section_frames, ignore_index=True)
+        codes = flat_df["Status"].map(_STATUS_INDEX).to_numpy().reshape(_WEIGHT_MATRIX.shape)
+
+        # Nothing assessed (all codes still 0): skip the chart, tables, and
+        # save entirely rather than reporting the vacuous all-100 default.
+        if not codes.any():
+            st.markdown(_NOT_ASSESSED_HTML, unsafe_allow_html=True)
+            return
+
+        totals = (_WEIGHT_MATRIX * (codes != 4)).sum(axis=1)
+        earned = (_WEIGHT_MATRIX * _CREDIT_FACTORS[codes]).sum(axis=1)
+        scores = np.full_like(totals, 100.0)
+        np.divide(earned * 100.0, totals, out=scores, where=totals > 0)
+        section_scores = dict(zip(_ASSESSMENT_SECTIONS, scores.tolist()))
+
+        assessment_results = {
+            section: {
+                row.ID: {"text": row.Item, "priority": row.Priority, "status": row.Status}
+                for row in frame.itertuples()
+            }
+            for section, frame in zip(_ASSESSMENT_SECTIONS, section_frames)
+        }
+
+        # Overall Score
+        overall_score = float(scores.mean())
+
+        overall_status, status_color = next(
+            (status, color) for threshold, status, color in _READINESS_LUT if overall_score >= threshold
+        )
+        critical_issues = int(
+            (flat_df["Priority"].eq("Critical") & flat_df["Status"].eq("Non-Compliant")).sum()
+        )
+
+        # Summary Cards: all three in one grid element instead of three
+        # columns each carrying its own markdown block.
+        st.markdown(
+            '<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">'
+            + _METRIC_CARD.format(color=status_color, value=f"{overall_score:.1f}%", label="Overall Compliance Score")
+            + _METRIC_CARD.format(color=status_color, value=overall_status, label="Readiness Status")
+            + _METRIC_CARD.format(
+                color="#c53030" if critical_issues > 0 else "#38a169",
+                value=critical_issues,
+                label="Critical Issues",
+            )
+            + "</div>",
+            unsafe_allow_html=True,
+        )
+
+        # Section Breakdown
+        st.markdown("#### Section Breakdown")
+
+        st.plotly_chart(_score_chart(tuple(section_scores.items())), use_container_width=True)
+
+        # Non-Compliant Items
+        st.markdown("#### ⚠️ Items Requiring Attention")
+
+        # Vectorized filter over the flat table; Priority is an ordered
+        # categorical, so the severity sort needs no key callback.
+        attention_df = flat_df[flat_df["Status"].isin(("Non-Compliant", "Partial"))]
+
+        if not attention_df.empty:
+            attention_df = attention_df.assign(
+                Section=attention_df["Section"].str.split(". ", n=1).str[1],
+                Item=attention_df["Item"].str.slice(0, 50) + "...",
+            )[["ID", "Section", "Item", "Priority", "Status"]].sort_values("Priority")
+            # Hand st.dataframe an Arrow table directly; Streamlit ships
+            # Arrow IPC anyway, so this skips its pandas-to-Arrow step.
+            st.dataframe(
+                pa.Table.from_pandas(attention_df, preserve_index=False),
+                use_container_width=True,
+            )
+        else:
+            st.markdown(_ALL_COMPLIANT_HTML, unsafe_allow_html=True)
+
+        # Save assessment. The nested 64-item results dict dominates the
+        # record size, so it is stored as a compressed orjson blob and
+        # inflated by the export page on demand.
+        st.session_state.completed_assessments.append({
+            "timestamp": datetime.now().isoformat(),
+            "system_name": system_name,
+            "assessor": assessor_name,
+            "overall_score": overall_score,
+            "section_scores": section_scores,
+            "results": zlib.compress(orjson.dumps(assessment_results))
+        })
+
+
+_render()
@@ -0,0 +1,295 @@
+"""Case Studies & Scenarios page."""
+
+import streamlit as st
+import pandas as pd
+
+from pages import static_content
+
+@st.cache_data(max_entries=1)
+def _feature_issues_df() -> pd.DataFrame:
+    """Problematic features found in the Case 1 fair-lending review."""
+    return pd.DataFrame({
+        "Feature": [
+            "ZIP code stability",
+            "University attended",
+            "Social media sentiment",
+            "Employment industry",
+        ],
+        "Issue": [
+            "Correlated with neighborhood racial composition",
+            "Served as proxy for socioeconomic status",
+            "Biased training data from predominantly white users",
+            "Certain industries had minority overrepresentation",
+        ],
+        "Impact": [
+            "Disparate impact",
+            "Disparate impact",
+            "Algorithmic bias",
+            "Disparate impact",
+        ],
+    })
+
+
+@st.cache_data(max_entries=1)
+def _reg_implications_df() -> pd.DataFrame:
+    """Regulatory exposure table for Case 1, by jurisdiction."""
+    return pd.DataFrame({
+        "Jurisdiction": [
+            "United States",
+            "European Union",
+            "United Kingdom",
+        ],
+        "Applicable Framework": [
+            "ECOA, Fair Housing Act",
+            "EU AI Act (High-Risk), GDPR",
+            "Equality Act, FCA Consumer Duty",
+        ],
+        "Potential Consequence": [
+            "CFPB enforcement, civil penalties, restitution",
+            "Fines up to €35M or 7% turnover",
+            "FCA enforcement action, redress",
+        ],
+    })
+
+
+@st.cache_data(max_entries=1)
+def _trading_events_df() -> pd.DataFrame:
+    """Timeline of the Case 3 trading incident."""
+    return pd.DataFrame({
+        "Time": [
+            "9:31 AM",
+            "9:45 AM",
+            "10:15 AM",
+            "10:30 AM",
+            "11:00 AM",
+        ],
+        "Event": [
+            "Market opens with 3% gap down",
+            "System adds leverage, misreading signals",
+            "Markets stabilize, then drop again",
+            "Kill switch activated",
+            "Investigation begins",
+        ],
+        "Impact": [
+            "AI increases position size",
+            "Exposure increases 3x",
+            "Losses accelerate",
+            "$180M loss crystallized",
+            "Trading suspended",
+        ],
+    })
+
+
+_KEY_CONCERNS = (
+    "Potential for discrimination based on protected characteristics",
+    "Privacy and consent issues",
+    "Difficulty in explaining decisions to consumers",
+    "Regulatory compliance uncertainty",
+)
+
+_ESSENTIAL_SAFEGUARDS = (
+    "Comprehensive disparate impact testing",
+    "Explainability solution for adverse actions",
+    "Ongoing fairness monitoring",
+)
+
+
+# Score-tier result cards, selected by lookup instead of rebuilding the
+# HTML inside the submit handler.
+_RESULT_CARDS = {
+    "excellent": """
+<div class="success-card">
+    <h4>🎯 Excellent Risk Assessment</h4>
+    <p>Your decision demonstrates strong understanding of AI ethics and regulatory requirements.</p>
+</div>
+""",
+    "good": """
+<div class="warning-card">
+    <h4>⚠️ Good Foundation, Room for Improvement</h4>
+    <p>Your decision shows awareness of key issues but may have some gaps.</p>
+</div>
+""",
+    "poor": """
+<div style="background: #fed7d7; border-left: 4px solid #c53030; padding: 1.5rem; border-radius: 0 8px 8px 0;">
+    <h4>❌ Significant Risk Exposure</h4>
+    <p>Your decision may expose the organization to regulatory and reputational risks.</p>
+</div>
+""",
+}
+
+
+@st.cache_data(max_entries=256)
+def _score_decision(q1: str, q2: tuple, q3: tuple, q4: str) -> tuple[int, tuple]:
+    """Score a scenario decision and return (score, feedback lines).
+
+    Pure function of the four answers, so repeat submissions of the same
+    combination hit the cache. Multiselect answers are passed as sorted
+    tuples to make the cache key order-insensitive.
+    """
+    score = 0
+    feedback = []
+
+    if "Conditional approval" in q1 or "Request more information" in q1:
+        score += 25
+        feedback.append("✅ **Good approach:** Requesting conditions or more information shows appropriate caution")
+    elif "Decline" in q1:
+        score += 20
+        feedback.append("⚠️ **Cautious approach:** While declining is safe, conditional approval with strong safeguards may be viable")
+    else:
+        feedback.append("❌ **Risky approach:** Approving without conditions ignores significant risks")
+
+    matched_concerns = len([c for c in q2 if c in _KEY_CONCERNS])
+    score += matched_concerns * 10
+
+    if matched_concerns >= 3:
+        feedback.append(f"✅ **Strong risk identification:** You identified {matched_concerns}/4 key concerns")
+    elif matched_concerns >= 2:
+        feedback.append(f"⚠️ **Partial risk identification:** You identified {matched_concerns}/4 key concerns")
+    else:
+        feedback.append(f"❌ **Risk blind spots:** You only identified {matched_concerns}/4 key concerns")
+
+    matched_safeguards = len([s for s in q3 if s in _ESSENTIAL_SAFEGUARDS])
+    score += matched_safeguards * 10
+
+    if matched_safeguards == 3:
+        feedback.append("✅ **Comprehensive safeguards:** You identified all essential safeguards")
+    else:
+        missing = [s for s in _ESSENTIAL_SAFEGUARDS if s not in q3]
+        feedback.append(f"⚠️ **Missing safeguards:** Consider adding: {', '.join(missing)}")
+
+    if q4 == "All of the above":
+        score += 15
+        feedback.append("✅ **Regulatory awareness:** Correct - multiple frameworks apply")
+    elif "None" in q4:
+        feedback.append("❌ **Regulatory blind spot:** This is definitely a regulated activity")
+
+    return score, tuple(feedback)
+
+
+@st.fragment
+def _interactive_scenario() -> None:
+    """Interactive fraud-scenario exercise, isolated in its own fragment.
+
+    Every radio/multiselect change and the Submit click rerun only this
+    function, not the whole page render with its three case-study tabs.
+    """
+    st.markdown(static_content.SCENARIO_BRIEF_MD)
+
+    st.markdown("---")
+
+    # Decision Points
+    st.markdown("#### 🤔 Decision Points")
+
+    q1 = st.radio(
+        "1. What is your initial reaction to this proposal?",
+        [
+            "Approve - the accuracy improvement justifies the approach",
+            "Conditional approval - needs additional safeguards",
+            "Request more information before deciding",
+            "Decline - too many risks outweigh benefits"
+        ]
+    )
+
+    q2 = st.multiselect(
+        "2. What are your primary concerns? (Select all that apply)",
+        [
+            "Potential for discrimination based on protected characteristics",
+            "Privacy and consent issues",
+            "Difficulty in explaining decisions to consumers",
+            "Regulatory compliance uncertainty",
+            "Data quality and reliability",
+            "Reputational risk",
+            "Third-party data provider risks"
+        ]
+    )
+
+    q3 = st.multiselect(
+        "3. What safeguards would you require before approval? (Select all that apply)",
+        [
+            "Comprehensive disparate impact testing",
+            "Legal review of data collection practices",
+            "Consumer disclosure and consent mechanisms",
+            "Explainability solution for adverse actions",
+            "Ongoing fairness monitoring",
+            "Human review for edge cases",
+            "Regulatory consultation",
+            "External audit of the approach"
+        ]
+    )
+
+    q4 = st.radio(
+        "4. Which regulatory frameworks are most relevant to this decision?",
+        [
+            "ECOA/Fair Credit Reporting Act (US)",
+            "EU AI Act and GDPR",
+            "UK FCA Consumer Duty",
+            "All of the above",
+            "None - this is purely a business decision"
+        ]
+    )
+
+    if st.button("Submit Decision"):
+        st.markdown("---")
+        st.markdown("#### 📊 Analysis of Your Decision")
+
+        score, feedback = _score_decision(q1, tuple(sorted(q2)), tuple(sorted(q3)), q4)
+
+        # Display results
+        tier = "excellent" if score >= 70 else "good" if score >= 50 else "poor"
+        st.markdown(_RESULT_CARDS[tier], unsafe_allow_html=True)
+
+        st.markdown("#### Detailed Feedback\n\n" + "\n\n".join(feedback))
+
+        st.markdown(static_content.SCENARIO_EXPERT_MD)
+
+
+@st.fragment
+def _render() -> None:
+    """Render the Case Studies & Scenarios page."""
+    st.markdown(static_content.CASES_INTRO_HTML, unsafe_allow_html=True)
+
+    case_tabs = st.tabs([
+        "📊 Case Study 1: Credit Scoring",
+        "🤖 Case Study 2: Chatbot Failure",
+        "📈 Case Study 3: Algorithmic Trading",
+        "🎯 Interactive Scenario"
+    ])
+
+    # Case Study 1: Credit Scoring Bias
+    with case_tabs[0]:
+        st.markdown(static_content.CASE1_OVERVIEW_HTML, unsafe_allow_html=True)
+
+        st.markdown(static_content.CASE1_BODY_MD)
+        st.dataframe(_feature_issues_df(), hide_index=True, use_container_width=True)
+        st.markdown(static_content.CASE1_ANALYSIS_MD)
+
+        st.markdown(static_content.CASE1_LESSONS_MD)
+
+        st.markdown(static_content.CASE1_REGULATORY_MD)
+        st.dataframe(_reg_implications_df(), hide_index=True, use_container_width=True)
+
+    # Case Study 2: Chatbot Failure
+    with case_tabs[1]:
+        st.markdown(static_content.CASE2_OVERVIEW_HTML, unsafe_allow_html=True)
+
+        st.markdown(static_content.CASE2_BODY_MD)
+
+        st.markdown(static_content.CASE2_LESSONS_MD)
+
+        st.markdown(static_content.CASE2_CFPB_MD)
+
+    # Case Study 3: Algorithmic Trading
+    with case_tabs[2]:
+        st.markdown(static_content.CASE3_OVERVIEW_HTML, unsafe_allow_html=True)
+
+        st.markdown(static_content.CASE3_BODY_MD)
+        st.dataframe(_trading_events_df(), hide_index=True, use_container_width=True)
+        st.markdown(static_content.CASE3_ANALYSIS_MD)
+
+        st.markdown(static_content.CASE3_LESSONS_MD)
+
+    # Interactive Scenario
+    with case_tabs[3]:
+        _interactive_scenario()
+
+_render()
@@ -0,0 +1,283 @@
+"""Export & Reports page."""
+
+import streamlit as st
+import copy
+import io
+import zlib
+from datetime import datetime
+
+import orjson
+
+
+@st.cache_resource
+def _doc_template():
+    """Blank python-docx Document, parsed from the default template once
+    per process. Export clicks deep-copy this instead of re-parsing the
+    template XML on every report generation."""
+    from docx import Document
+    return Document()
+
+
+def _inflate(assessment: dict) -> dict:
+    """Return an assessment with its compressed results blob expanded.
+
+    The checklist page stores the nested per-item results as a
+    zlib-compressed orjson payload to keep session state small; exports
+    need the readable dict back.
+    """
+    blob = assessment.get("results")
+    if not isinstance(blob, bytes):
+        return assessment
+    expanded = dict(assessment)
+    expanded["results"] = orjson.loads(zlib.decompress(blob))
+    return expanded
+
+
+def _to_json_bytes(obj) -> bytes:
+    """Serialize export payloads with orjson (~5x faster than stdlib json on
+    dict-heavy state). default=str covers datetimes and any other
+    non-JSON-native values stored in session state."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+
+
+@st.cache_data(max_entries=8)
+def _build_docx_report(state_bytes: bytes) -> bytes:
+    """Build the comprehensive Word report from the serialized session state.
+
+    Keyed on the orjson payload so clicking Generate again with unchanged
+    assessments returns the cached bytes instead of rebuilding the document.
+    """
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+    state = orjson.loads(state_bytes)
+
+    # Initialize Document from the cached template
+    doc = copy.deepcopy(_doc_template())
+
+    # Title
+    title = doc.add_heading('FinTech AI Ethics & Governance Report', 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    doc.add_paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y at %H:%M')}")
+    doc.add_paragraph("Tool Version: 1.0.0")
+    doc.add_paragraph("_" * 50) # Horizontal line simulation
+
+    # 1. Executive Summary
+    doc.add_heading('1. Executive Summary', level=1)
+    doc.add_paragraph(
+        "This report summarizes the AI ethics and governance assessment conducted using "
+        "the FinTech AI Ethics & Governance Toolkit. It includes risk identification, "
+        "governance framework definitions, and ethical assessment checklists."
+    )
+
+    # 2. Risk Assessment Section
+    doc.add_heading('2. Risk Assessment', level=1)
+    risk_data = state.get("risk_assessment") or {}
+    if risk_data:
+        p = doc.add_paragraph()
+        p.add_run("Use Case: ").bold = True
+        p.add_run(f"{risk_data.get('use_case', 'N/A')}\n")
+        p.add_run("Risk Level: ").bold = True
+        p.add_run(f"{risk_data.get('risk_level', 'Unknown')}\n")
+        p.add_run("Overall Score: ").bold = True
+        p.add_run(f"{risk_data.get('overall_score', 0):.1f}/100")
+
+        doc.add_heading('Category Scores:', level=2)
+        for cat, score in zip(risk_data.get('categories', ()), risk_data.get('category_scores', ())):
+            doc.add_paragraph(f"{cat}: {score:.1f}%", style='List Bullet')
+    else:
+        doc.add_paragraph("Risk assessment not yet completed.")
+
+    # 3. Governance Framework Section
+    doc.add_heading('3. Governance Framework', level=1)
+    gov_data = state.get("governance_framework") or {}
+    if gov_data:
+        doc.add_heading('Key Roles', level=2)
+        structure = gov_data.get('structure', {})
+        if structure:
+            doc.add_paragraph(f"AI Officer: {structure.get('ai_officer', 'Not defined')}")
+            doc.add_paragraph(f"Risk Owner: {structure.get('ai_risk_owner', 'Not defined')}")
+
+        doc.add_heading('Policy Status', level=2)
+        for policy, status in gov_data.get('policies', {}).items():
+            doc.add_paragraph(f"{policy}: {status}", style='List Bullet')
+    else:
+        doc.add_paragraph("Governance framework not yet generated.")
+
+    # 4. Ethical Assessments Section
+    doc.add_heading('4. Ethical Assessments', level=1)
+    assessments = state.get("ethical_assessments") or []
+    if assessments:
+        for i, assessment in enumerate(assessments, 1):
+            doc.add_heading(f"Assessment {i}: {assessment.get('system_name')}", level=2)
+            doc.add_paragraph(f"Assessor: {assessment.get('assessor')}")
+            doc.add_paragraph(f"Date: {assessment.get('timestamp')}")
+            doc.add_paragraph(f"Score: {assessment.get('overall_score'):.1f}%")
+
+            # Add section scores table
+            table = doc.add_table(rows=1, cols=2)
+            table.style = 'Table Grid'
+            hdr_cells = table.rows[0].cells
+            hdr_cells[0].text = 'Section'
+            hdr_cells[1].text = 'Compliance Score'
+
+            for section, score in assessment.get('section_scores', {}).items():
+                row_cells = table.add_row().cells
+                row_cells[0].text = str(section)
+                row_cells[1].text = f"{score:.1f}%"
+            doc.add_paragraph() # Spacer
+    else:
+        doc.add_paragraph("No ethical assessments completed.")
+
+    # Save to Memory Buffer
+    bio = io.BytesIO()
+    doc.save(bio)
+    return bio.getvalue()
+
+
+@st.fragment
+def _render() -> None:
+    """Render the Export & Reports page."""
+    st.markdown('<h1 class="main-header">💾 Export & Reports</h1>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="info-card">
+        <p>Generate and export reports from your assessments for documentation,
+        audit, and compliance purposes.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Available Exports
+    st.markdown("### 📤 Available Exports")
+
+    export_col1, export_col2 = st.columns(2)
+
+    with export_col1:
+        st.markdown("#### 📊 Risk Assessment Report")
+        if st.session_state.risk_assessment:
+            st.markdown("""
+            <div class="success-card">
+                <p>✅ Risk assessment data available</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            if st.button("📥 Export Risk Assessment (JSON)"):
+                risk_json = _to_json_bytes(st.session_state.risk_assessment)
+                st.download_button(
+                    label="Download Risk Assessment",
+                    data=risk_json,
+                    file_name=f"risk_assessment_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                    mime="application/json"
+                )
+        else:
+            st.markdown("""
+            <div class="warning-card">
+                <p>⚠️ No risk assessment completed. Complete the Risk Identification Tool first.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with export_col2:
+        st.markdown("#### 🔧 Governance Framework")
+        if st.session_state.governance_plan:
+            st.markdown("""
+            <div class="success-card">
+                <p>✅ Governance framework data available</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            if st.button("📥 Export Governance Framework (JSON)"):
+                gov_json = _to_json_bytes(st.session_state.governance_plan)
+                st.download_button(
+                    label="Download Governance Framework",
+                    data=gov_json,
+                    file_name=f"governance_framework_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                    mime="application/json"
+                )
+        else:
+            st.markdown("""
+            <div class="warning-card">
+                <p>⚠️ No governance framework created. Use the Governance Framework Builder first.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Completed Assessments
+    st.markdown("### ✅ Completed Ethical Assessments")
+
+    if st.session_state.completed_assessments:
+        for i, assessment in enumerate(st.session_state.completed_assessments):
+            with st.expander(f"Assessment: {assessment.get('system_name', 'Unnamed')} - {assessment['timestamp'][:10]}"):
+                assessment = _inflate(assessment)
+                st.json(assessment)
+
+                assessment_json = _to_json_bytes(assessment)
+                st.download_button(
+                    label=f"📥 Download Assessment {i+1}",
+                    data=assessment_json,
+                    file_name=f"ethical_assessment_{i+1}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                    mime="application/json",
+                    key=f"download_assessment_{i}"
+                )
+    else:
+        st.markdown("""
+        <div class="warning-card">
+            <p>⚠️ No ethical assessments completed. Use the Ethical Assessment Checklist first.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Comprehensive Report Generator
+    st.markdown("### 📋 Generate Comprehensive Report")
+
+    st.markdown("""
+    Generate a comprehensive report combining all available assessment data.
+    """)
+
+    # Selection for report format
+    report_format = st.selectbox(
+        "Report Format:",
+        ["DOCX (Microsoft Word)", "JSON (Machine-readable)"]
+    )
+
+    if st.button("📄 Generate Comprehensive Report", type="primary"):
+        ethical_assessments = [_inflate(a) for a in st.session_state.completed_assessments]
+        state_bytes = _to_json_bytes({
+            "risk_assessment": st.session_state.risk_assessment,
+            "governance_framework": st.session_state.governance_plan,
+            "ethical_assessments": ethical_assessments
+        })
+
+        # JSON Logic (kept for machine readability)
+        if report_format == "JSON (Machine-readable)":
+            report_json = _to_json_bytes({
+                "report_metadata": {
+                    "generated_at": datetime.now().isoformat(),
+                    "tool_version": "1.0.0"
+                },
+                "risk_assessment": st.session_state.risk_assessment,
+                "governance_framework": st.session_state.governance_plan,
+                "ethical_assessments": ethical_assessments
+            })
+            st.download_button(
+                label="📥 Download Comprehensive Report (JSON)",
+                data=report_json,
+                file_name=f"ai_ethics_report_{datetime.now().strftime('%Y%m%d')}.json",
+                mime="application/json"
+            )
+
+        # DOCX Logic — cached on the serialized state, so regenerating with
+        # unchanged assessments skips the document build entirely.
+        else:
+            st.download_button(
+                label="📥 Download Comprehensive Report (DOCX)",
+                data=_build_docx_report(state_bytes),
+                file_name=f"ai_ethics_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx",
+                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+            )
+
+        st.success("Report generated successfully!")
+
+
+_render()
@@ -0,0 +1,527 @@
+"""Governance Framework Builder page."""
+
+from types import MappingProxyType
+
+import streamlit as st
+import pandas as pd
+
+# Static page chrome, allocated once at import so reruns reuse the same
+# string objects.
+_INTRO_HTML = """
+<h1 class="main-header">🔧 Governance Framework Builder</h1>
+<div class="info-card">
+    <p>Build a customized AI governance framework for your organization. This tool helps you 
+    establish the policies, procedures, and controls needed for responsible AI deployment in 
+    financial services.</p>
+</div>
+"""
+
+_SUCCESS_CARD_HTML = """
+<div class="success-card">
+    <h4>Framework Summary</h4>
+    <p>Your customized AI governance framework has been generated. 
+    You can export this framework from the Export & Reports section.</p>
+</div>
+"""
+
+# Static option lists for the builder widgets, allocated once at import so
+# reruns hand Streamlit the same objects instead of rebuilding dozens of
+# lists per interaction.
+_ORG_SIZES = (
+    "Startup (<50 employees)", "SME (50-250 employees)",
+    "Mid-size (250-1000 employees)", "Large Enterprise (1000+ employees)",
+)
+
+_PRIMARY_BUSINESSES = (
+    "Retail Banking", "Commercial Banking", "Investment Banking",
+    "Asset Management", "Insurance", "Payments/FinTech",
+    "Lending Platform", "WealthTech", "RegTech", "Other",
+)
+
+_REGULATORY_STATUSES = (
+    "Fully Regulated (Bank License)", "Regulated (Other License)",
+    "Registered/Authorized", "Unregulated (Partner with Licensed Entity)",
+    "Seeking Authorization",
+)
+
+_AI_MATURITY_LEVELS = (
+    "Exploring (No Production AI)", "Emerging (1-2 Production Systems)",
+    "Established (Multiple Production Systems)", "Advanced (AI-First Organization)",
+)
+
+_COMMITTEE_FREQUENCIES = ("Monthly", "Bi-monthly", "Quarterly")
+
+# (label, responsibility options) per line of defense; the first two options
+# of each line are the multiselect defaults.
+_LINES_OF_DEFENSE = (
+    ("**1st Line: Business Units**", (
+        "AI use case identification",
+        "Initial risk assessment",
+        "Model performance monitoring",
+        "User acceptance testing",
+        "Incident escalation",
+    )),
+    ("**2nd Line: Risk & Compliance**", (
+        "Independent model validation",
+        "Regulatory compliance review",
+        "Fairness/bias testing",
+        "Policy development",
+        "Training and awareness",
+    )),
+    ("**3rd Line: Internal Audit**", (
+        "Governance effectiveness audit",
+        "Process compliance audit",
+        "Controls testing",
+        "Third-party audit oversight",
+        "Board reporting",
+    )),
+)
+
+_CORE_POLICIES = (
+    ("AI Ethics Policy", "Defines ethical principles and values for AI use"),
+    ("AI Risk Management Policy", "Framework for identifying and managing AI risks"),
+    ("Model Risk Management Policy", "SR 11-7 aligned model governance"),
+    ("Data Governance Policy", "Data quality, privacy, and usage standards"),
+    ("Third-Party AI Policy", "Vendor due diligence and oversight"),
+    ("AI Transparency Policy", "Explainability and disclosure requirements"),
+    ("AI Fairness Policy", "Bias prevention and fairness testing"),
+    ("AI Incident Management Policy", "Response procedures for AI failures"),
+)
+
+_KEY_PROCEDURES = (
+    "AI Use Case Approval Process",
+    "Model Validation Procedures",
+    "Fairness Testing Procedures",
+    "AI Incident Escalation Procedures",
+    "AI Change Management Procedures",
+    "Third-Party AI Due Diligence Procedures",
+    "AI Documentation Standards",
+    "Consumer Disclosure Procedures",
+)
+
+_STATUS_OPTIONS = ("Not Started", "In Development", "Under Review", "Approved", "N/A")
+
+# Statuses that do not count as "defined" in the summary metrics.
+_EXCLUDED_STATUSES = frozenset({"Not Started", "N/A"})
+
+_RISK_TAXONOMY = (
+    "Model Risk (performance, drift, failure)",
+    "Fairness/Discrimination Risk",
+    "Data Quality Risk",
+    "Privacy/Data Protection Risk",
+    "Cybersecurity Risk",
+    "Operational/Reliability Risk",
+    "Regulatory/Compliance Risk",
+    "Reputational Risk",
+    "Third-Party/Concentration Risk",
+    "Strategic Risk (misalignment with objectives)",
+)
+
+_RISK_TAXONOMY_DEFAULT = (
+    "Model Risk (performance, drift, failure)",
+    "Fairness/Discrimination Risk",
+    "Regulatory/Compliance Risk",
+)
+
+_RISK_APPROACHES = (
+    "Quantitative (numerical scoring, statistical analysis)",
+    "Qualitative (expert judgment, categorical ratings)",
+    "Hybrid (combination of quantitative and qualitative)",
+)
+
+_RISK_FREQUENCIES = ("Continuous/Real-time", "Monthly", "Quarterly", "Annually", "Event-driven only")
+
+_APPETITE_LEVELS = ("Zero Tolerance", "Very Low", "Low", "Moderate", "High")
+
+# (plan key, slider label) per risk-appetite dimension; the first two render
+# in the left column, the last two in the right.
+_APPETITE_DIMS = (
+    ("fairness", "Fairness Risk Tolerance:", "appetite_fairness"),
+    ("model", "Model Risk Tolerance:", "appetite_model"),
+    ("regulatory", "Regulatory Risk Tolerance:", "appetite_regulatory"),
+    ("reputational", "Reputational Risk Tolerance:", "appetite_reputational"),
+)
+
+_LIFECYCLE_STAGES = MappingProxyType({
+    "🎯 Planning & Design": (
+        "Use case business justification",
+        "Ethical impact assessment",
+        "Regulatory classification",
+        "Data requirements analysis",
+        "Stakeholder identification",
+        "Success criteria definition",
+    ),
+    "🔨 Development": (
+        "Data quality validation",
+        "Feature selection review",
+        "Model selection justification",
+        "Bias testing during training",
+        "Code review requirements",
+        "Version control",
+    ),
+    "🧪 Testing & Validation": (
+        "Independent model validation",
+        "Fairness/bias testing",
+        "Performance testing",
+        "Stress testing",
+        "User acceptance testing",
+        "Security testing",
+    ),
+    "🚀 Deployment": (
+        "Deployment approval process",
+        "Rollback procedures",
+        "Monitoring implementation",
+        "Documentation completeness check",
+        "Training completion verification",
+        "Regulatory notification (if required)",
+    ),
+    "📊 Monitoring & Maintenance": (
+        "Performance monitoring",
+        "Drift detection",
+        "Fairness monitoring",
+        "Incident logging",
+        "Periodic revalidation",
+        "Decommissioning criteria",
+    ),
+})
+
+# Widget keys and stage headings formatted once at import instead of
+# per item per rerun.
+_LIFECYCLE_ROWS = tuple(
+    (f"##### {stage}", stage, controls, f"lifecycle_{stage}")
+    for stage, controls in _LIFECYCLE_STAGES.items()
+)
+
+_KPI_OPTIONS = (
+    "Model accuracy/performance metrics",
+    "Fairness metrics (demographic parity, equal opportunity)",
+    "Drift detection scores",
+    "Incident count and severity",
+    "Regulatory findings",
+    "Customer complaints related to AI",
+    "Adverse action appeal rates",
+    "Third-party SLA compliance",
+    "Model validation coverage",
+    "Training completion rates",
+)
+
+_BOARD_FREQUENCIES = ("Quarterly", "Semi-annually", "Annually")
+
+_BOARD_CONTENT = (
+    "AI risk dashboard", "Regulatory compliance status",
+    "Incident summary", "Strategic initiatives", "External audit findings",
+)
+
+_MGMT_FREQUENCIES = ("Weekly", "Monthly", "Quarterly")
+
+_MGMT_CONTENT = (
+    "Operational metrics", "Issue/incident log", "Project status",
+    "Validation results", "Regulatory updates",
+)
+
+
+@st.cache_data(max_entries=1)
+def _policies_df() -> pd.DataFrame:
+    """Initial policy-status table for the data editor, built once."""
+    return pd.DataFrame(_CORE_POLICIES, columns=["Policy", "Description"]).assign(Status="Not Started")
+
+
+@st.cache_data(max_entries=1)
+def _procedures_df() -> pd.DataFrame:
+    """Initial procedure-status table for the data editor, built once."""
+    return pd.DataFrame({"Procedure": _KEY_PROCEDURES, "Status": "Not Started"})
+
+@st.fragment
+def _render() -> None:
+    """Render the Governance Framework Builder page."""
+    # Header and intro card emitted as one element to keep the delta count down.
+    st.markdown(_INTRO_HTML, unsafe_allow_html=True)
+
+    # One form around the whole builder: widget edits are held in the
+    # browser and the script reruns once on submit instead of once per
+    # selectbox/checkbox/slider change (~40 widgets otherwise rerun the
+    # page on every interaction).
+    with st.form("governance_form"):
+        # Organization Profile
+        st.markdown("### 📋 Organization Profile")
+
+        org_col1, org_col2 = st.columns(2)
+
+        with org_col1:
+            org_size = st.selectbox("Organization Size:", _ORG_SIZES)
+
+            primary_business = st.selectbox("Primary Business:", _PRIMARY_BUSINESSES)
+
+        with org_col2:
+            regulatory_status = st.selectbox("Regulatory Status:", _REGULATORY_STATUSES)
+
+            ai_maturity = st.selectbox("AI Maturity Level:", _AI_MATURITY_LEVELS)
+
+        st.markdown("---")
+
+        # Framework Components
+        st.markdown("### 🏗️ Governance Framework Components")
+
+        framework_tabs = st.tabs([
+            "1️⃣ Governance Structure", 
+            "2️⃣ Policies & Procedures",
+            "3️⃣ Risk Management",
+            "4️⃣ Lifecycle Controls",
+            "5️⃣ Monitoring & Reporting"
+        ])
+
+        # Tab 1: Governance Structure
+        with framework_tabs[0]:
+            st.markdown(
+                "#### Organizational Structure for AI Governance\n\n"
+                "Define the key roles and committees responsible for AI governance:"
+            )
+
+            # Accountability Framework
+            st.markdown("##### 👤 Accountability Framework")
+
+            acc_col1, acc_col2 = st.columns(2)
+
+            with acc_col1:
+                ai_officer = st.text_input("Chief AI/Data Officer (or equivalent):", 
+                                            placeholder="Name and title")
+                ai_sponsor = st.text_input("Executive Sponsor for AI:", 
+                                            placeholder="Board/C-suite member")
+
+            with acc_col2:
+                ai_risk_owner = st.text_input("AI Risk Owner:", 
+                                               placeholder="Head of Risk/CRO")
+                ai_ethics_owner = st.text_input("AI Ethics/Compliance Owner:", 
+                                                 placeholder="CCO/Ethics Officer")
+
+            # Committees
+            st.markdown("##### 🏛️ Committee Structure")
+
+            # Inside a form, ticking a checkbox does not rerun the script, so
+            # the committee fields render unconditionally instead of appearing
+            # only after the box is ticked.
+            has_ai_committee = st.checkbox("AI Ethics/Governance Committee established")
+            committee_frequency = st.selectbox(
+                "Committee Meeting Frequency:", _COMMITTEE_FREQUENCIES, key="committee_frequency"
+            )
+            committee_chair = st.text_input("Committee Chair:", key="committee_chair")
+            committee_members = st.text_area("Committee Members (one per line):", key="committee_members")
+
+            has_model_committee = st.checkbox("Model Risk Committee established")
+            has_data_committee = st.checkbox("Data Governance Committee established")
+
+            # Lines of Defense
+            st.markdown("##### 🛡️ Three Lines of Defense")
+
+            lod_responses = []
+            for i, (col, (label, options)) in enumerate(zip(st.columns(3), _LINES_OF_DEFENSE)):
+                with col:
+                    st.markdown(label)
+                    lod_responses.append(st.multiselect(
+                        "Responsibilities:",
+                        options,
+                        default=options[:2],
+                        key=f"lod_{i}",
+                    ))
+            first_line_resp, second_line_resp, third_line_resp = lod_responses
+
+        # Tab 2: Policies & Procedures
+        with framework_tabs[1]:
+            st.markdown(
+                "#### Core AI Policies\n\n"
+                "Select the policies your organization has or needs to develop:"
+            )
+
+            # One data editor instead of eight columns+selectbox pairs: two
+            # widgets replace ~24 per-policy elements and the statuses come
+            # back as a single edited frame.
+            edited_policies = st.data_editor(
+                _policies_df(),
+                column_config={
+                    "Status": st.column_config.SelectboxColumn(options=list(_STATUS_OPTIONS), required=True)
+                },
+                disabled=["Policy", "Description"],
+                hide_index=True,
+                use_container_width=True,
+                key="policies_editor",
+            )
+
+            # Procedures
+            st.markdown("---\n\n#### Key Procedures")
+
+            edited_procedures = st.data_editor(
+                _procedures_df(),
+                column_config={
+                    "Status": st.column_config.SelectboxColumn(options=list(_STATUS_OPTIONS), required=True)
+                },
+                disabled=["Procedure"],
+                hide_index=True,
+                use_container_width=True,
+                key="procedures_editor",
+            )
+
+        # Tab 3: Risk Management
+        with framework_tabs[2]:
+            st.markdown(
+                "#### AI Risk Management Framework\n\n"
+                "Define your approach to AI risk identification, assessment, and management:"
+            )
+
+            # Risk Taxonomy
+            st.markdown("##### 📊 Risk Taxonomy")
+
+            risk_taxonomy = st.multiselect(
+                "Risk Categories to Address:",
+                _RISK_TAXONOMY,
+                default=_RISK_TAXONOMY_DEFAULT,
+            )
+
+            # Risk Assessment Approach
+            st.markdown("##### 🎯 Risk Assessment Methodology")
+
+            risk_approach = st.radio("Risk Assessment Approach:", _RISK_APPROACHES)
+
+            risk_frequency = st.selectbox("Risk Assessment Frequency:", _RISK_FREQUENCIES)
+
+            # Risk Appetite
+            st.markdown("##### 🎚️ Risk Appetite\n\nDefine your organization's AI risk appetite:")
+
+            appetite_cols = st.columns(2)
+            appetites = {
+                dim: appetite_cols[i // 2].select_slider(
+                    label, options=_APPETITE_LEVELS, key=key
+                )
+                for i, (dim, label, key) in enumerate(_APPETITE_DIMS)
+            }
+
+        # Tab 4: Lifecycle Controls
+        with framework_tabs[3]:
+            st.markdown(
+                "#### AI System Lifecycle Controls\n\n"
+                "Define controls at each stage of the AI system lifecycle:"
+            )
+
+            lifecycle_controls = {}
+
+            for heading, stage, controls, key in _LIFECYCLE_ROWS:
+                st.markdown(heading)
+                lifecycle_controls[stage] = st.multiselect(
+                    "Select required controls:",
+                    controls,
+                    default=controls[:3],
+                    key=key
+                )
+
+        # Tab 5: Monitoring & Reporting
+        with framework_tabs[4]:
+            # Key Metrics
+            st.markdown(
+                "#### Monitoring & Reporting Framework\n\n"
+                "##### 📈 Key Performance Indicators (KPIs)"
+            )
+
+            selected_kpis = st.multiselect(
+                "Select KPIs to Track:",
+                _KPI_OPTIONS,
+                default=_KPI_OPTIONS[:5],
+            )
+
+            # Reporting Structure
+            st.markdown("##### 📋 Reporting Structure")
+
+            report_col1, report_col2 = st.columns(2)
+
+            with report_col1:
+                st.markdown("**Board Reporting:**")
+                board_frequency = st.selectbox("Frequency:", _BOARD_FREQUENCIES, key="board_freq")
+                board_content = st.multiselect(
+                        "Content:",
+                        _BOARD_CONTENT,
+                        default=_BOARD_CONTENT[:2],
+                    )
+
+            with report_col2:
+                st.markdown("**Management Reporting:**")
+                mgmt_frequency = st.selectbox("Frequency:", _MGMT_FREQUENCIES, key="mgmt_freq")
+                mgmt_content = st.multiselect(
+                        "Content:",
+                        _MGMT_CONTENT,
+                        default=_MGMT_CONTENT[:2],
+                    )
+
+            # Audit Requirements
+            st.markdown("##### 🔍 Audit Requirements")
+
+            internal_audit = st.checkbox("Annual internal audit of AI governance", value=True)
+            external_audit = st.checkbox("External/independent AI audit")
+            regulatory_exam = st.checkbox("Regulatory examination preparation")
+
+        st.markdown("---")
+
+        submitted = st.form_submit_button("📄 Generate Governance Framework", type="primary")
+
+    # Generate Framework: the plan is assembled only on submit, from the
+    # final widget values, instead of rebuilding the nested dicts on every
+    # rerun of the page.
+    if submitted:
+        governance_plan = {
+            "structure": {
+                "ai_officer": ai_officer,
+                "ai_sponsor": ai_sponsor,
+                "ai_risk_owner": ai_risk_owner,
+                "ai_ethics_owner": ai_ethics_owner,
+                "has_ai_committee": has_ai_committee,
+                "has_model_committee": has_model_committee,
+                "has_data_committee": has_data_committee,
+                "first_line": first_line_resp,
+                "second_line": second_line_resp,
+                "third_line": third_line_resp
+            },
+            "policies": dict(zip(edited_policies["Policy"], edited_policies["Status"])),
+            "procedures": dict(zip(edited_procedures["Procedure"], edited_procedures["Status"])),
+            "risk_management": {
+                "taxonomy": risk_taxonomy,
+                "approach": risk_approach,
+                "frequency": risk_frequency,
+                "appetite": appetites
+            },
+            "lifecycle_controls": lifecycle_controls,
+            "monitoring": {
+                "kpis": selected_kpis,
+                "board_reporting": {"frequency": board_frequency, "content": board_content},
+                "management_reporting": {"frequency": mgmt_frequency, "content": mgmt_content},
+                "internal_audit": internal_audit,
+                "external_audit": external_audit,
+                "regulatory_exam": regulatory_exam
+            },
+        }
+        # app.py setdefaults governance_plan to {} per session; updating the
+        # existing dict in place avoids clobbering the container other pages
+        # may already hold a reference to.
+        st.session_state.governance_plan.update(governance_plan)
+
+        st.markdown("### ✅ Governance Framework Generated")
+
+        st.markdown(_SUCCESS_CARD_HTML, unsafe_allow_html=True)
+
+        # Summary Statistics
+        summary_col1, summary_col2, summary_col3 = st.columns(3)
+
+        with summary_col1:
+            policies_defined = sum(
+                1 for s in governance_plan.get("policies", {}).values() if s not in _EXCLUDED_STATUSES
+            )
+            st.metric("Policies Defined", f"{policies_defined}/8")
+
+        with summary_col2:
+            procedures_defined = sum(
+                1 for s in governance_plan.get("procedures", {}).values() if s not in _EXCLUDED_STATUSES
+            )
+            st.metric("Procedures Defined", f"{procedures_defined}/8")
+
+        with summary_col3:
+            total_controls = sum(map(len, governance_plan.get("lifecycle_controls", {}).values()))
+            st.metric("Lifecycle Controls", total_controls)
+
+
+_render()
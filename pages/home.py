@@ -0,0 +1,128 @@
+"""Home & Overview page."""
+
+import streamlit as st
+import pandas as pd
+
+# Static Home page copy, allocated once at import.
+_HOME_INTRO_HTML = """
+<h1 class="main-header">⚖️ FinTech AI Ethics & Governance Toolkit</h1>
+<div class="info-card">
+    <h3>🎯 Purpose</h3>
+    <p>This comprehensive toolkit helps finance professionals and students identify, assess, and govern
+    the ethical and responsible use of AI and technology in financial services. Built on the latest
+    global regulations and best practices, this tool provides practical frameworks for real-world application.</p>
+</div>
+"""
+
+_HOME_PRINCIPLES_LEFT = """
+#### 🎯 Fairness
+AI systems must not discriminate against individuals or groups based on protected characteristics.
+This includes ensuring equitable outcomes in credit scoring, lending decisions, and financial product offerings.
+
+**Key Considerations:**
+- Demographic parity in outcomes
+- Equal opportunity across groups
+- Bias detection and mitigation
+- Regular fairness audits
+
+---
+
+#### 🔍 Transparency
+Financial institutions must be able to explain how AI systems make decisions, especially for
+high-stakes outcomes affecting consumers.
+
+**Key Considerations:**
+- Explainable AI (XAI) implementation
+- Clear adverse action notices
+- Model documentation standards
+- Consumer-friendly explanations
+"""
+
+_HOME_PRINCIPLES_RIGHT = """
+#### 👤 Accountability
+Clear lines of responsibility must exist for AI system outcomes. Organizations need defined
+roles and escalation procedures for AI-related decisions.
+
+**Key Considerations:**
+- Senior management oversight
+- Audit trails and logging
+- Incident response procedures
+- Third-party accountability
+
+---
+
+#### 🔒 Privacy & Security
+AI systems must protect personal data and maintain robust security measures throughout
+the data lifecycle.
+
+**Key Considerations:**
+- Data minimization principles
+- Consent management
+- Secure data handling
+- Privacy-preserving techniques
+"""
+
+
+@st.cache_data(max_entries=1)
+def _quickstart_df() -> pd.DataFrame:
+    """Static quick-start table. Cached so the DataFrame is built once per
+    process and reruns hit Streamlit's data cache; the same pattern applies
+    to any constant-data builder on the other pages."""
+    return pd.DataFrame({
+        "Step": ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣"],
+        "Action": [
+            "Review Regulations",
+            "Identify Risks",
+            "Build Governance",
+            "Complete Assessment",
+            "Study Cases",
+            "Export Report",
+        ],
+        "Description": [
+            "Familiarize yourself with applicable regulatory frameworks for your jurisdiction",
+            "Use the Risk Identification Tool to catalog potential AI ethics risks",
+            "Create a tailored governance framework using our builder",
+            "Run through the comprehensive ethical assessment checklist",
+            "Learn from real-world scenarios and case studies",
+            "Generate documentation for compliance and audit purposes",
+        ],
+    })
+
+
+@st.fragment
+def _render() -> None:
+    """Render the Home & Overview page."""
+    # Header and purpose card are consecutive HTML fragments; emitting them as one
+    # element keeps the delta message count (and React reconcile work) down.
+    st.markdown(_HOME_INTRO_HTML, unsafe_allow_html=True)
+
+    # Key Statistics — native st.metric widgets let Streamlit diff-update the
+    # existing DOM nodes across reruns instead of re-parsing raw HTML.
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Major Regulatory Frameworks", "4+")
+    col2.metric("Risk Categories Covered", "50+")
+    col3.metric("Assessment Questions", "100+")
+    col4.metric("Regulations Updated", "2025")
+
+    st.markdown("---")
+
+    # Core Principles Overview
+    st.markdown('<h2 class="sub-header">🌟 Core Ethical Principles in FinTech AI</h2>', unsafe_allow_html=True)
+
+    principles_col1, principles_col2 = st.columns(2)
+
+    with principles_col1:
+        st.markdown(_HOME_PRINCIPLES_LEFT)
+
+    with principles_col2:
+        st.markdown(_HOME_PRINCIPLES_RIGHT)
+
+    st.markdown("---")
+
+    # Quick Start Guide
+    st.markdown('<h2 class="sub-header">🚀 Quick Start Guide</h2>', unsafe_allow_html=True)
+
+    st.dataframe(_quickstart_df(), use_container_width=True, hide_index=True)
+
+
+_render()
@@ -0,0 +1,450 @@
+"""Global Regulatory Framework page."""
+
+from dataclasses import dataclass
+from typing import Callable
+
+import streamlit as st
+import pyarrow as pa
+
+import orjson
+
+_FRAMEWORK_LABELS = ["🇪🇺 EU AI Act", "🇺🇸 US Frameworks", "🇬🇧 UK FCA", "🇸🇬 Singapore MAS", "📋 Comparison Matrix"]
+
+# Page copy is constant; module-level literals are built once at import
+# instead of re-assembled into fresh strings on every rerun.
+_EU_INTRO_MD = """
+The EU AI Act is the world's first comprehensive legal framework on artificial intelligence. 
+It establishes a risk-based approach to AI governance with significant implications for financial services.
+"""
+
+# The EU risk-tier and NIST function pairs used to be two st.markdown calls
+# inside st.columns(2); each is now one flex-row HTML blob, so the section
+# emits one element instead of a container plus two children.
+_EU_RISK_COLUMNS_HTML = """
+<div style="display: flex; gap: 2rem;">
+<div style="flex: 1;">
+<strong>🔴 High-Risk AI Systems in Finance:</strong>
+<ul>
+<li>Credit scoring and creditworthiness evaluation</li>
+<li>Life and health insurance risk assessment and pricing</li>
+<li>Fraud detection systems (under certain conditions)</li>
+<li>Recruitment and HR decision-making systems</li>
+<li>Biometric identification systems</li>
+</ul>
+<strong>Requirements for High-Risk Systems:</strong>
+<ul>
+<li>Risk management system throughout lifecycle</li>
+<li>Data governance and quality requirements</li>
+<li>Technical documentation</li>
+<li>Record-keeping and logging</li>
+<li>Transparency and user information</li>
+<li>Human oversight mechanisms</li>
+<li>Accuracy, robustness, and cybersecurity</li>
+</ul>
+</div>
+<div style="flex: 1;">
+<strong>🟡 Limited Risk AI Systems:</strong>
+<ul>
+<li>Chatbots and conversational AI</li>
+<li>Emotion recognition systems (non-prohibited uses)</li>
+<li>Biometric categorization (non-prohibited uses)</li>
+</ul>
+<strong>Requirements:</strong>
+<ul>
+<li>Transparency obligations (disclosure of AI interaction)</li>
+</ul>
+<hr>
+<strong>🟢 Minimal Risk AI Systems:</strong>
+<ul>
+<li>AI-enabled spam filters</li>
+<li>AI in video games</li>
+<li>Inventory management systems</li>
+</ul>
+<strong>Requirements:</strong>
+<ul>
+<li>Voluntary codes of conduct encouraged</li>
+</ul>
+</div>
+</div>
+"""
+
+_US_INTRO_MD = """
+The US takes a sector-specific approach to AI regulation, with multiple agencies having jurisdiction 
+over AI in financial services. Key frameworks include NIST AI RMF and agency-specific guidance.
+"""
+
+_US_NIST_INTRO_MD = """
+Released January 2023, updated February 2024, with a Generative AI Profile added July 2024.
+The framework provides voluntary guidance organized around four core functions:
+"""
+
+_US_NIST_COLUMNS_HTML = """
+<div style="display: flex; gap: 2rem;">
+<div style="flex: 1;">
+<strong>🏛️ GOVERN</strong>
+<ul>
+<li>Establish AI governance structures</li>
+<li>Define roles and responsibilities</li>
+<li>Create policies and procedures</li>
+<li>Foster organizational culture for responsible AI</li>
+</ul>
+<strong>🗺️ MAP</strong>
+<ul>
+<li>Context and use case definition</li>
+<li>Stakeholder identification</li>
+<li>Risk framing and scoping</li>
+<li>Impact assessment</li>
+</ul>
+</div>
+<div style="flex: 1;">
+<strong>📏 MEASURE</strong>
+<ul>
+<li>Metrics and evaluation criteria</li>
+<li>Testing and validation</li>
+<li>Bias and fairness assessment</li>
+<li>Performance monitoring</li>
+</ul>
+<strong>🔧 MANAGE</strong>
+<ul>
+<li>Risk treatment and mitigation</li>
+<li>Continuous monitoring</li>
+<li>Incident response</li>
+<li>Documentation and reporting</li>
+</ul>
+</div>
+</div>
+"""
+
+_US_CFPB_GUIDANCE_MD = """
+**Adverse Action Notices (2022 Circular):**
+- Creditors using complex algorithms must still provide specific reasons for adverse actions
+- "Black box" models don't exempt institutions from ECOA requirements
+- Must provide principal reasons for credit denials, even when using AI
+
+**Chatbot Guidance (2023):**
+- Chatbots cannot replace required disclosures
+- Must recognize when consumers invoke statutory rights
+- Inaccurate information may constitute UDAAP violation
+
+**Alternative Data (2024):**
+- Alternative data must meet same fair lending standards
+- Disparate impact liability applies to AI decisions
+- Regular bias testing required
+"""
+
+_UK_INTRO_MD = """
+The UK adopts a principles-based approach to AI regulation, relying on existing frameworks 
+while the FCA develops sector-specific guidance. The FCA confirmed in September 2025 that 
+it does not plan to introduce extra regulations for AI, instead relying on existing frameworks.
+"""
+
+_UK_AI_LAB_MD = """
+**AI Lab (Launched October 2024):**
+- **Supercharged Sandbox**: Enhanced testing with NVIDIA partnership
+- **AI Live Testing**: Real-world AI deployment testing
+- **AI Spotlight**: Showcasing innovative AI solutions
+- **AI Sprint**: Stakeholder engagement events
+- **AI Input Zone**: Feedback collection mechanism
+"""
+
+_UK_SURVEY_MD = """
+**Key Findings from 2024 Survey:**
+- 75% of regulated firms already using AI
+- Additional 10% planning AI adoption within 3 years
+- 84% have accountable person for AI framework
+- 72% report executive leadership accountability
+
+**Top Regulatory Constraints:**
+- Data protection and privacy (23% large constraint)
+- Resilience and cybersecurity (12% large constraint)
+- Consumer Duty compliance (5% large constraint)
+"""
+
+_UK_CONSUMER_DUTY_MD = """
+The Consumer Duty (effective July 2023) has significant implications for AI in financial services:
+
+**Consumer Understanding:**
+- AI-driven communications must be clear and understandable
+- Explanations of AI decisions must be accessible to consumers
+
+**Products & Services:**
+- AI-designed products must meet genuine customer needs
+- Target market assessments must account for AI-driven personalization
+
+**Price & Value:**
+- AI-driven pricing must deliver fair value
+- Dynamic pricing algorithms under scrutiny
+
+**Consumer Support:**
+- AI chatbots must provide adequate support
+- Human escalation must be available
+- Vulnerable customer needs must be recognized
+"""
+
+_SG_INTRO_MD = """
+Singapore has pioneered a collaborative, principles-based approach to AI governance through 
+the FEAT principles and Veritas initiative, creating practical tools for responsible AI adoption.
+"""
+
+_SG_FEAT_FE_MD = """
+**F - Fairness**
+- AI systems should not systematically disadvantage individuals or groups
+- Regular assessment for unintended bias
+- Fairness metrics aligned with business context
+- Remediation processes for identified biases
+
+**E - Ethics**
+- AI use aligned with organizational values
+- Ethical review of AI applications
+- Clear ethical guidelines for AI development
+- Stakeholder impact consideration
+"""
+
+_SG_FEAT_AT_MD = """
+**A - Accountability**
+- Clear ownership and responsibility for AI systems
+- Documented decision-making processes
+- Audit trails for AI decisions
+- Escalation procedures for AI issues
+
+**T - Transparency**
+- Explainability appropriate to stakeholder needs
+- Clear communication of AI use to customers
+- Documentation of model logic and limitations
+- Disclosure of AI involvement in decisions
+"""
+
+_SG_VERITAS_INTRO_MD = """
+The Veritas initiative provides practical tools for implementing FEAT principles:
+"""
+
+_SG_MINDFORGE_MD = """
+MindForge extends Veritas to address Generative AI risks in financial services:
+
+**Key Focus Areas:**
+- IP and copyright risks in GenAI outputs
+- Hallucination and misinformation risks
+- Data privacy in training and inference
+- Model governance for LLMs
+- Third-party AI provider oversight
+
+**Participating Organizations:**
+- Major banks: DBS, OCBC, UOB, HSBC, Standard Chartered
+- Tech providers: Google, Microsoft
+- Consulting: EY, Accenture
+
+**Recommendations:**
+- Extend FEAT principles to GenAI context
+- Implement robust testing for hallucinations
+- Establish clear accountability for AI outputs
+- Develop GenAI-specific governance frameworks
+"""
+
+_TAKEAWAYS_HTML = """
+<div class="success-card">
+    <h4>🔑 Key Takeaways for Global Compliance</h4>
+    <ul>
+        <li><strong>EU AI Act sets the global standard</strong> - Many organizations are aligning with EU requirements even outside Europe</li>
+        <li><strong>Existing laws still apply</strong> - No jurisdiction exempts AI from existing consumer protection, fair lending, or data protection laws</li>
+        <li><strong>Documentation is universal</strong> - All frameworks require some form of documentation and audit trails</li>
+        <li><strong>Human oversight is essential</strong> - All frameworks emphasize human accountability for AI decisions</li>
+        <li><strong>Proactive bias testing</strong> - All frameworks expect regular assessment for discrimination and unfair outcomes</li>
+    </ul>
+</div>
+"""
+
+_INTRO_HTML = """
+<div class="info-card">
+    <p>This section provides a comprehensive overview of the major AI regulations affecting
+    financial technology globally. Understanding these frameworks is essential for ensuring
+    compliance and ethical AI deployment.</p>
+</div>
+"""
+
+
+# Consecutive static emits per section are pre-joined into one block, so a
+# section view sends one delta message instead of three or four. Joined once
+# at import; markdown and inline HTML coexist fine under unsafe_allow_html.
+_EU_LEAD = "\n\n".join([
+    _EU_INTRO_MD,
+    "#### 📅 Implementation Timeline",
+])
+
+_US_LEAD = "\n\n".join([
+    _US_INTRO_MD,
+    "#### 📊 NIST AI Risk Management Framework (AI RMF 1.0/2.0)",
+    _US_NIST_INTRO_MD,
+])
+
+_UK_LEAD = "\n\n".join([
+    _UK_INTRO_MD,
+    "#### 🎯 UK Government's Five AI Principles",
+])
+
+_SG_LEAD = "\n\n".join([
+    _SG_INTRO_MD,
+    "#### 🎯 FEAT Principles (2018)",
+])
+
+_SG_VERITAS_LEAD = "\n\n".join([
+    "#### 🔧 Veritas Initiative",
+    _SG_VERITAS_INTRO_MD,
+])
+
+_PAGE_LEAD = "\n\n".join([
+    '<h1 class="main-header">📜 Global Regulatory Framework</h1>',
+    _INTRO_HTML,
+])
+
+# The table contents live in data/regulations_tables.json rather than inline
+# dict literals, keeping this module's bytecode small. The file is read and
+# converted to Arrow once per process; st.dataframe takes pa.Table directly.
+@st.cache_resource
+def _tables() -> dict:
+    """Column data for this page's tables, keyed by table name."""
+    with open("data/regulations_tables.json", "rb") as f:
+        raw = orjson.loads(f.read())
+    return {name: pa.table(columns) for name, columns in raw.items()}
+
+
+def _eu_body() -> None:
+    """EU AI Act framework body (after the shared lead-in)."""
+    st.dataframe(_tables()["eu_timeline"], use_container_width=True, hide_index=True)
+
+    # Risk Categories
+    st.markdown("#### 🎚️ Risk Classification for FinTech")
+
+    st.html(_EU_RISK_COLUMNS_HTML)
+
+    # Penalties
+    st.markdown("#### ⚠️ Penalties for Non-Compliance")
+    st.dataframe(_tables()["eu_penalties"], use_container_width=True, hide_index=True)
+
+
+def _us_body() -> None:
+    """US frameworks body (after the shared lead-in)."""
+
+    st.html(_US_NIST_COLUMNS_HTML)
+
+    # CFPB and Other Agencies
+    st.markdown("#### 🏦 Agency-Specific Requirements")
+
+    st.dataframe(_tables()["us_agencies"], use_container_width=True, hide_index=True)
+
+    # Key CFPB Guidance. A toggle instead of an expander: a collapsed
+    # expander still executes and ships its body every rerun, while the
+    # toggle skips the emit entirely until opened.
+    if st.toggle("📋 CFPB Key Guidance on AI", key="reg_cfpb_open"):
+        st.markdown(_US_CFPB_GUIDANCE_MD)
+
+
+def _uk_body() -> None:
+    """UK FCA body (after the shared lead-in)."""
+    st.dataframe(_tables()["uk_principles"], use_container_width=True, hide_index=True)
+
+    # FCA Initiatives
+    st.markdown("#### 🔬 FCA AI Initiatives (2024-2025)")
+
+    init_col1, init_col2 = st.columns(2)
+
+    with init_col1:
+        st.markdown(_UK_AI_LAB_MD)
+
+    with init_col2:
+        st.markdown(_UK_SURVEY_MD)
+
+    # Consumer Duty
+    if st.toggle("📜 Consumer Duty & AI", key="reg_duty_open"):
+        st.markdown(_UK_CONSUMER_DUTY_MD)
+
+
+def _sg_body() -> None:
+    """Singapore MAS body (after the shared lead-in)."""
+
+    feat_col1, feat_col2 = st.columns(2)
+
+    with feat_col1:
+        st.markdown(_SG_FEAT_FE_MD)
+
+    with feat_col2:
+        st.markdown(_SG_FEAT_AT_MD)
+
+    # Veritas Initiative
+    st.markdown(_SG_VERITAS_LEAD)
+
+    st.dataframe(_tables()["sg_veritas"], use_container_width=True, hide_index=True)
+
+    # MindForge
+    if st.toggle("🧠 Project MindForge - Generative AI", key="reg_mindforge_open"):
+        st.markdown(_SG_MINDFORGE_MD)
+
+
+def _matrix_body() -> None:
+    """Comparison matrix body (after the shared lead-in)."""
+    # A static 10x5 grid of strings has no use for the interactive data grid
+    # (sorting, virtualization); st.table emits plain HTML instead of
+    # initializing the Glide grid component.
+    st.table(_tables()["comparison"])
+
+    # Key Takeaways
+    st.html(_TAKEAWAYS_HTML)
+
+
+@dataclass(frozen=True, slots=True)
+class _RegSpec:
+    """One framework section: shared lead-in fields plus its body renderer."""
+    header: str
+    body: Callable[[], None]
+    badge: str = ""
+    badge_color: str = "blue"
+    lead: str = ""
+
+
+# Declarative section table keyed by the radio label; the duplicated
+# heading/badge/lead code per section collapses into one render path.
+_SPECS = dict(zip(_FRAMEWORK_LABELS, [
+    _RegSpec("European Union AI Act", _eu_body,
+             badge="Effective: August 2024 - Full Compliance: August 2026",
+             badge_color="blue", lead=_EU_LEAD),
+    _RegSpec("United States AI Regulatory Framework", _us_body,
+             badge="Voluntary Framework with Sector-Specific Enforcement",
+             badge_color="violet", lead=_US_LEAD),
+    _RegSpec("UK Financial Conduct Authority (FCA)", _uk_body,
+             badge="Principles-Based, Outcomes-Focused Regulation",
+             badge_color="red", lead=_UK_LEAD),
+    _RegSpec("Singapore Monetary Authority (MAS)", _sg_body,
+             badge="FEAT Principles & Veritas Framework",
+             badge_color="green", lead=_SG_LEAD),
+    _RegSpec("Regulatory Comparison Matrix", _matrix_body),
+]))
+
+
+def _render_section(spec: _RegSpec) -> None:
+    """Emit a section's heading, badge, and lead, then run its body."""
+    st.html(f'<h2 class="sub-header">{spec.header}</h2>')
+    if spec.badge:
+        st.badge(spec.badge, color=spec.badge_color)
+    if spec.lead:
+        st.markdown(spec.lead)
+    spec.body()
+
+
+@st.fragment
+def _render() -> None:
+    """Render the Regulatory Framework page."""
+    st.html(_PAGE_LEAD)
+
+    # A radio drives framework selection instead of st.tabs: st.tabs executes
+    # every tab body on each rerun even though only one is visible, so with
+    # five sections this page did ~5x the render work it needed to.
+    choice = st.radio(
+        "Framework",
+        _FRAMEWORK_LABELS,
+        horizontal=True,
+        key="reg_tab",
+        label_visibility="collapsed",
+    )
+    _render_section(_SPECS[choice])
+
+
+_render()
@@ -0,0 +1,119 @@
+"""Resources & Documentation page."""
+
+import streamlit as st
+import pandas as pd
+
+from pages import static_content
+
+@st.cache_data(max_entries=1)
+def _best_practices_df() -> pd.DataFrame:
+    """Industry best-practice resources for the frameworks tab."""
+    return pd.DataFrame({
+        "Organization": [
+            "Partnership on AI",
+            "IEEE",
+            "WEF",
+            "GFIN",
+        ],
+        "Resource": [
+            "Best Practices",
+            "Ethically Aligned Design",
+            "AI Governance Alliance",
+            "Regulatory Innovation",
+        ],
+        "Focus": [
+            "Cross-industry AI ethics",
+            "Technical ethics standards",
+            "Multi-stakeholder governance",
+            "Cross-border fintech regulation",
+        ],
+    })
+
+
+@st.cache_data(max_entries=1)
+def _courses_df() -> pd.DataFrame:
+    """Online courses listed on the learning tab."""
+    return pd.DataFrame({
+        "Course": [
+            "AI Ethics",
+            "Responsible AI",
+            "Fairness in ML",
+            "AI Governance",
+        ],
+        "Provider": [
+            "MIT",
+            "Google",
+            "Microsoft",
+            "Stanford HAI",
+        ],
+        "Focus": [
+            "Foundational ethics",
+            "Practical implementation",
+            "Technical fairness",
+            "Governance frameworks",
+        ],
+    })
+
+
+@st.cache_data(max_entries=1)
+def _assessment_tools_df() -> pd.DataFrame:
+    """Open assessment tools listed on the tools tab."""
+    return pd.DataFrame({
+        "Tool": [
+            "Veritas Toolkit",
+            "AI Fairness 360",
+            "Fairlearn",
+            "What-If Tool",
+            "SHAP",
+            "LIME",
+        ],
+        "Purpose": [
+            "FEAT assessment",
+            "Bias detection",
+            "Fairness assessment",
+            "Model exploration",
+            "Explainability",
+            "Local explanations",
+        ],
+        "Source": [
+            "MAS/GitHub",
+            "IBM",
+            "Microsoft",
+            "Google",
+            "Open source",
+            "Open source",
+        ],
+    })
+
+
+@st.fragment
+def _render() -> None:
+    """Render the Resources & Documentation page."""
+    st.markdown(static_content.RESOURCES_INTRO_HTML, unsafe_allow_html=True)
+
+    resource_tabs = st.tabs([
+        "📜 Official Regulations",
+        "📖 Frameworks & Guidelines",
+        "🎓 Learning Resources",
+        "🔧 Tools & Templates"
+    ])
+
+    with resource_tabs[0]:
+        st.markdown(static_content.RESOURCES_REGULATIONS_MD)
+
+    with resource_tabs[1]:
+        st.markdown(static_content.RESOURCES_FRAMEWORKS_MD)
+        st.dataframe(_best_practices_df(), hide_index=True, use_container_width=True)
+
+    with resource_tabs[2]:
+        st.markdown(static_content.RESOURCES_LEARNING_MD)
+        st.dataframe(_courses_df(), hide_index=True, use_container_width=True)
+        st.markdown(static_content.RESOURCES_VIDEO_MD)
+
+    with resource_tabs[3]:
+        st.markdown(static_content.RESOURCES_TOOLS_MD)
+        st.dataframe(_assessment_tools_df(), hide_index=True, use_container_width=True)
+        st.markdown(static_content.RESOURCES_TEMPLATES_MD)
+
+
+_render()
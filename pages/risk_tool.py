@@ -0,0 +1,459 @@
+"""AI Risk Identification Tool page."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+import streamlit as st
+import numpy as np
+from datetime import datetime
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# Questionnaire structure and mitigation playbook are fixed content. They are
+# built once at import and wrapped read-only, so every radio-click rerun
+# reuses the same objects instead of reallocating ~60 dicts and lists.
+_RISK_CATEGORIES = MappingProxyType({
+    "Fairness & Discrimination": {
+        "questions": (
+            ("Does the AI system make decisions that directly impact credit access or pricing?", 3),
+            ("Does the system use demographic data or proxies (zip codes, names)?", 3),
+            ("Is the training data representative of all customer segments?", 2),
+            ("Have you conducted disparate impact testing?", 2),
+            ("Can the system's decisions be overridden by human review?", 2)
+        ),
+        "weight": 1.0
+    },
+    "Transparency & Explainability": {
+        "questions": (
+            ("Can you explain individual decisions to affected customers?", 3),
+            ("Is the model's logic documented and understandable?", 2),
+            ("Do you provide adverse action notices with specific reasons?", 3),
+            ("Can regulators audit the decision-making process?", 2),
+            ("Is there documentation of model limitations?", 2)
+        ),
+        "weight": 0.9
+    },
+    "Data Quality & Privacy": {
+        "questions": (
+            ("Is personal data collected with appropriate consent?", 3),
+            ("Are data retention policies in place and enforced?", 2),
+            ("Is training data checked for quality and accuracy?", 2),
+            ("Are data sources from third parties properly vetted?", 2),
+            ("Is data anonymization/pseudonymization used where appropriate?", 2)
+        ),
+        "weight": 0.85
+    },
+    "Security & Robustness": {
+        "questions": (
+            ("Is the AI system tested for adversarial attacks?", 2),
+            ("Are there monitoring systems for model drift?", 2),
+            ("Is the system resilient to input anomalies?", 2),
+            ("Are cybersecurity measures adequate for the data sensitivity?", 3),
+            ("Is there a disaster recovery plan for the AI system?", 2)
+        ),
+        "weight": 0.8
+    },
+    "Accountability & Governance": {
+        "questions": (
+            ("Is there a designated senior manager accountable for AI?", 3),
+            ("Are there clear escalation procedures for AI issues?", 2),
+            ("Is there an AI ethics committee or review board?", 2),
+            ("Are third-party AI providers subject to due diligence?", 2),
+            ("Is there regular board/executive reporting on AI risks?", 2)
+        ),
+        "weight": 0.9
+    },
+    "Regulatory Compliance": {
+        "questions": (
+            ("Have you mapped AI use to applicable regulations?", 3),
+            ("Are you prepared for EU AI Act high-risk classification?", 3),
+            ("Is there a process for regulatory change monitoring?", 2),
+            ("Have you conducted a compliance gap analysis?", 2),
+            ("Is regulatory reporting capability in place?", 2)
+        ),
+        "weight": 1.0
+    }
+})
+
+_MITIGATIONS = MappingProxyType({
+    "Fairness & Discrimination": (
+        "Implement demographic parity testing across all protected characteristics",
+        "Document and justify any use of proxy variables",
+        "Establish regular fairness audits (quarterly minimum)",
+        "Create human override procedures for edge cases",
+        "Develop bias incident response procedures"
+    ),
+    "Transparency & Explainability": (
+        "Implement LIME or SHAP for individual decision explanations",
+        "Create consumer-friendly explanation templates for adverse actions",
+        "Document model logic, features, and limitations",
+        "Establish regulatory inquiry response procedures",
+        "Train customer service on explaining AI decisions"
+    ),
+    "Data Quality & Privacy": (
+        "Conduct comprehensive data mapping and consent audit",
+        "Implement data quality checks in AI pipeline",
+        "Review and update data retention policies",
+        "Conduct third-party data source due diligence",
+        "Implement privacy-enhancing technologies where feasible"
+    ),
+    "Security & Robustness": (
+        "Conduct adversarial robustness testing",
+        "Implement model drift monitoring",
+        "Establish input validation and anomaly detection",
+        "Review cybersecurity measures for AI infrastructure",
+        "Develop AI-specific incident response procedures"
+    ),
+    "Accountability & Governance": (
+        "Designate senior AI accountability officer",
+        "Establish AI ethics committee/review board",
+        "Create third-party AI provider governance framework",
+        "Implement regular board reporting on AI risks",
+        "Develop clear escalation procedures"
+    ),
+    "Regulatory Compliance": (
+        "Conduct comprehensive regulatory mapping exercise",
+        "Assess EU AI Act classification and requirements",
+        "Establish regulatory change monitoring process",
+        "Conduct gap analysis against all applicable frameworks",
+        "Develop regulatory reporting capabilities"
+    )
+})
+
+# Numbered recommendation lists pre-rendered to markdown at import: each
+# expander emits one element instead of one message per recommendation.
+_MITIGATION_MD = {
+    category: "\n".join(f"{i}. {rec}" for i, rec in enumerate(recs, 1))
+    for category, recs in _MITIGATIONS.items()
+}
+
+# Response scoring as a lookup table: radio answers are the indices into
+# _CREDIT_TABLE (N/A is NaN so it can be masked out of the denominator).
+# Per-category question weights are preconverted to float64 arrays once.
+_CATEGORY_NAMES = tuple(_RISK_CATEGORIES)
+
+
+@dataclass(slots=True, frozen=True)
+class RiskAssessment:
+    """Saved result of one risk analysis run.
+
+    Slotted and frozen so each stored assessment carries eight fixed fields
+    instead of a nested dict tree; answers are kept as integer response codes
+    per category rather than repeating all 30 question strings. orjson
+    serializes dataclasses natively, so the export page keeps working on the
+    field names below.
+    """
+
+    timestamp: str
+    use_case: str
+    jurisdictions: tuple[str, ...]
+    overall_score: float
+    risk_level: str
+    categories: tuple[str, ...]
+    category_scores: tuple[float, ...]
+    response_codes: tuple[tuple[int, ...], ...]
+
+
+_RESPONSE_OPTIONS = ("Yes - Fully Implemented", "Partial - In Progress", "No - Not Addressed", "N/A")
+_CREDIT_TABLE = np.array([1.0, 0.5, 0.0, np.nan])
+_QUESTION_WEIGHTS = {
+    category: np.array([weight for _, weight in config["questions"]], dtype=np.float64)
+    for category, config in _RISK_CATEGORIES.items()
+}
+# Full-credit denominator per category, specialized at import; scoring only
+# subtracts the weights of N/A answers from it.
+_MAX_SCORE = {category: float(weights.sum()) for category, weights in _QUESTION_WEIGHTS.items()}
+
+# Score buckets for risk classification: digitize against [60, 80) picks the
+# label/color branchlessly for both the per-category and overall scores.
+_LEVEL_BINS = np.array([60.0, 80.0])
+_LEVEL_LABELS = np.array(["High", "Medium", "Low"])
+_LEVEL_COLORS = np.array(["#c53030", "#dd6b20", "#38a169"])
+
+
+def _risk_bucket(score: float) -> tuple[str, str]:
+    """Map a 0-100 score to its (level, color) pair by table lookup."""
+    i = int(np.digitize(score, _LEVEL_BINS))
+    return str(_LEVEL_LABELS[i]), str(_LEVEL_COLORS[i])
+
+_INTRO_HTML = """
+<div class="info-card">
+    <p>Use this interactive tool to identify and assess AI-related risks in your FinTech application. 
+    The tool categorizes risks across multiple dimensions and provides mitigation recommendations 
+    aligned with global regulatory requirements.</p>
+</div>
+"""
+
+_EU_WARNING_TEMPLATE = """
+<div class="warning-card">
+    <h4>⚠️ EU AI Act High-Risk Classification Alert</h4>
+    <p>Your use case (<strong>{}</strong>) is likely classified as <strong>HIGH-RISK</strong> 
+    under the EU AI Act. This requires:</p>
+    <ul>
+        <li>Comprehensive risk management system</li>
+        <li>Data governance and quality requirements</li>
+        <li>Technical documentation</li>
+        <li>Automatic logging and record-keeping</li>
+        <li>Transparency and user information</li>
+        <li>Human oversight mechanisms</li>
+        <li>Accuracy, robustness, and cybersecurity measures</li>
+    </ul>
+    <p><strong>Deadline:</strong> Full compliance required by August 2, 2026</p>
+</div>
+"""
+
+_GOOD_POSTURE_HTML = """
+<div class="success-card">
+    <h4>✅ Good Risk Posture</h4>
+    <p>Your assessment indicates a generally strong risk management posture. 
+    Continue to monitor and maintain your controls, and conduct regular reviews 
+    as regulations evolve.</p>
+</div>
+"""
+
+
+@lru_cache(maxsize=16)
+def _eu_warning_html(use_case: str) -> str:
+    """High-risk alert card for a use case; only ~11 distinct values occur."""
+    return _EU_WARNING_TEMPLATE.format(use_case)
+
+
+# Badge HTML per risk level, precomputed so render paths do a dict lookup
+# instead of re-formatting class names per emit.
+_RISK_BADGE_HTML = {
+    level: f'<div style="text-align: center; margin: 1rem 0;">'
+    f'<span class="risk-{level.lower()}" style="font-size: 1.25rem;">Risk Level: {level}</span></div>'
+    for level in ("High", "Medium", "Low")
+}
+
+@st.cache_data(max_entries=32)
+def _compute_scores(responses_tuple):
+    """Aggregate questionnaire responses into category and overall scores.
+
+    Takes the responses as a hashable nested tuple (category, answer codes
+    in question order) so identical questionnaires hit the cache instead of
+    re-running the weighted sums and DataFrame build.
+    """
+    risk_scores = {}
+    for category, answers in responses_tuple:
+        weights = _QUESTION_WEIGHTS[category]
+        idx = np.fromiter(answers, dtype=np.intp, count=len(weights))
+        credit = _CREDIT_TABLE[idx]
+        # N/A answers (NaN credit) drop out of both numerator and denominator;
+        # the full denominator is precomputed, so only N/A weights are summed.
+        max_score = _MAX_SCORE[category] - float(weights[np.isnan(credit)].sum())
+        category_score = float(np.nansum(credit * weights))
+
+        score = (category_score / max_score) * 100 if max_score > 0 else 100
+        risk_scores[category] = {"score": score, "weight": _RISK_CATEGORIES[category]["weight"]}
+
+    # Weighted average in vector form: one dot product instead of
+    # per-category Python sums.
+    n = len(risk_scores)
+    scores = np.fromiter((s["score"] for s in risk_scores.values()), dtype=np.float64, count=n)
+    weights = np.fromiter((s["weight"] for s in risk_scores.values()), dtype=np.float64, count=n)
+    total_weight = float(weights.sum())
+    overall_score = float(scores @ weights) / total_weight if total_weight > 0 else 0.0
+
+    levels = _LEVEL_LABELS[np.digitize(scores, _LEVEL_BINS)]
+    breakdown = (tuple(risk_scores), tuple(scores.tolist()), tuple(levels.tolist()))
+    return risk_scores, overall_score, breakdown
+
+
+@st.cache_data(max_entries=8)
+def _results_fig(overall_score: float, risk_color: str, breakdown: tuple) -> go.Figure:
+    """Readiness gauge and category breakdown as one subplot figure.
+
+    A single st.plotly_chart means one chart component handshake and one
+    serialization round-trip instead of two. breakdown is the (categories,
+    scores, levels) tuple from _compute_scores; plain tuples feed the bar
+    traces directly and hash cheaply for the cache key.
+    """
+    fig = make_subplots(
+        rows=1, cols=2,
+        specs=[[{"type": "indicator"}, {"type": "xy"}]],
+        column_widths=[0.4, 0.6],
+    )
+    fig.add_trace(go.Indicator(
+        mode="gauge+number",
+        value=overall_score,
+        title={'text': "Overall Risk Readiness Score"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': risk_color},
+            'steps': [
+                {'range': [0, 60], 'color': "#fed7d7"},
+                {'range': [60, 80], 'color': "#feebc8"},
+                {'range': [80, 100], 'color': "#c6f6d5"}
+            ],
+            'threshold': {
+                'line': {'color': "black", 'width': 4},
+                'thickness': 0.75,
+                'value': overall_score
+            }
+        }
+    ), row=1, col=1)
+
+    categories, scores, levels = breakdown
+    for level, color in (("Low", "#38a169"), ("Medium", "#dd6b20"), ("High", "#c53030")):
+        xs = [c for c, lv in zip(categories, levels) if lv == level]
+        if xs:
+            ys = [s for s, lv in zip(scores, levels) if lv == level]
+            fig.add_trace(
+                go.Bar(x=xs, y=ys, name=level, marker_color=color),
+                row=1, col=2,
+            )
+
+    fig.update_layout(height=400, xaxis_tickangle=-45, legend_title_text="Risk Level")
+    return fig
+
+
+@st.fragment
+def _render() -> None:
+    """Render the Risk Identification Tool page."""
+    st.markdown('<h1 class="main-header">⚠️ AI Risk Identification Tool</h1>', unsafe_allow_html=True)
+
+    st.markdown(_INTRO_HTML, unsafe_allow_html=True)
+
+    # Use Case Selection
+    st.markdown("### Step 1: Define Your AI Use Case")
+
+    use_case_col1, use_case_col2 = st.columns(2)
+
+    with use_case_col1:
+        use_case_type = st.selectbox(
+            "AI Application Type:",
+            [
+                "Credit Scoring/Underwriting",
+                "Fraud Detection",
+                "Customer Service Chatbot",
+                "Investment Advisory (Robo-Advisor)",
+                "Anti-Money Laundering (AML)",
+                "Insurance Underwriting/Pricing",
+                "Marketing/Personalization",
+                "Trading/Algorithmic Trading",
+                "KYC/Identity Verification",
+                "Collections/Debt Management",
+                "Other"
+            ]
+        )
+
+        deployment_stage = st.selectbox(
+            "Deployment Stage:",
+            ["Planning/Design", "Development", "Testing", "Production", "Legacy System Review"]
+        )
+
+    with use_case_col2:
+        jurisdictions = st.multiselect(
+            "Operating Jurisdictions:",
+            ["European Union", "United States", "United Kingdom", "Singapore", "Other APAC", "Other"]
+        )
+
+        customer_type = st.multiselect(
+            "Customer Types:",
+            ["Retail Consumers", "Small Business", "Corporate/Institutional", "High Net Worth"]
+        )
+
+    st.markdown("---")
+
+    # Risk Assessment Questionnaire
+    st.markdown("### Step 2: Risk Assessment Questionnaire")
+
+    # Store responses; scoring happens in the cached _compute_scores call.
+    responses = {}
+
+    # Category toggles stay outside the form below: widgets inside a form
+    # only take effect on submit, which would make opening a section need a
+    # submit click. Closed categories render no radios; their answers come
+    # from the mirrored session-state keys so scoring still sees the full
+    # questionnaire.
+    toggle_cols = st.columns(3)
+    for i, category in enumerate(_RISK_CATEGORIES):
+        toggle_cols[i % 3].toggle(f"📋 {category}", key=f"open_{category}")
+
+    # The radios sit in a form, so answering questions queues the changes
+    # client-side and the script reruns once on submit instead of once per
+    # radio click.
+    with st.form("risk_assessment_form"):
+        for category, config in _RISK_CATEGORIES.items():
+            responses[category] = {}
+
+            if st.session_state.get(f"open_{category}"):
+                st.markdown(f"#### 📋 {category}")
+                for i, (question, weight) in enumerate(config["questions"]):
+                    # Integer-coded options: widget state carries a small int
+                    # and the labels come from format_func, so React diffs
+                    # index changes instead of comparing option strings.
+                    response = st.radio(
+                        question,
+                        range(len(_RESPONSE_OPTIONS)),
+                        format_func=_RESPONSE_OPTIONS.__getitem__,
+                        key=f"{category}_{i}",
+                        horizontal=True,
+                        index=st.session_state.get(f"resp_{category}_{i}", 0),
+                    )
+                    st.session_state[f"resp_{category}_{i}"] = response
+                    responses[category][question] = response
+            else:
+                for i, (question, _weight) in enumerate(config["questions"]):
+                    responses[category][question] = st.session_state.get(f"resp_{category}_{i}", 0)
+
+        submitted = st.form_submit_button("🔍 Generate Risk Analysis", type="primary")
+
+    st.markdown("---")
+
+    # Risk Analysis Results
+    if submitted:
+        st.markdown("### Step 3: Risk Analysis Results")
+
+        responses_tuple = tuple(
+            (category, tuple(answers.values())) for category, answers in responses.items()
+        )
+        risk_scores, overall_score, breakdown = _compute_scores(responses_tuple)
+
+        # Determine risk level
+        risk_level, risk_color = _risk_bucket(overall_score)
+
+        # Gauge and category breakdown share one figure; cached on its
+        # inputs, so regenerating with unchanged scores reuses the object.
+        st.plotly_chart(_results_fig(overall_score, risk_color, breakdown), use_container_width=True)
+
+        st.markdown(_RISK_BADGE_HTML[risk_level], unsafe_allow_html=True)
+
+        # High-Risk Jurisdiction Alert
+        if "European Union" in jurisdictions:
+            if use_case_type in ["Credit Scoring/Underwriting", "Insurance Underwriting/Pricing"]:
+                st.markdown(_eu_warning_html(use_case_type), unsafe_allow_html=True)
+
+        # Mitigation Recommendations
+        st.markdown("#### 🛠️ Priority Mitigation Recommendations")
+
+        # One SIMD comparison over the breakdown scores, then Python-level
+        # iteration only over the matching indices.
+        categories, scores, _levels = breakdown
+        low_mask = np.asarray(scores) < 70.0
+        low_score_categories = [categories[i] for i in np.flatnonzero(low_mask)]
+
+        if low_score_categories:
+            for category in low_score_categories:
+                with st.expander(f"🔧 {category} - Recommendations"):
+                    st.markdown(_MITIGATION_MD[category])
+        else:
+            st.markdown(_GOOD_POSTURE_HTML, unsafe_allow_html=True)
+
+        # Save to session state
+        st.session_state.risk_assessment = RiskAssessment(
+            timestamp=datetime.now().isoformat(),
+            use_case=use_case_type,
+            jurisdictions=tuple(jurisdictions),
+            overall_score=overall_score,
+            risk_level=risk_level,
+            categories=_CATEGORY_NAMES,
+            category_scores=tuple(risk_scores[cat]["score"] for cat in _CATEGORY_NAMES),
+            response_codes=tuple(codes for _category, codes in responses_tuple),
+        )
+
+
+_render()
@@ -0,0 +1,474 @@
+"""Static bodies for the case-study and resources pages.
+
+These pages are almost entirely fixed copy. Keeping the markdown and HTML
+blocks here as module constants means they are allocated once at import and
+every rerun hands Streamlit the same string objects, instead of rebuilding
+multi-kilobyte literals inside the render functions.
+"""
+
+CASES_INTRO_HTML = """
+<h1 class="main-header">📊 Case Studies & Scenarios</h1>
+<div class="info-card">
+    <p>Learn from real-world scenarios and case studies involving AI ethics in financial services. 
+    These examples illustrate common challenges and best practices for responsible AI deployment.</p>
+</div>
+"""
+
+CASE1_OVERVIEW_HTML = """
+### Case Study: Discriminatory Credit Scoring Model
+
+<div class="warning-card">
+    <h4>⚠️ Scenario Overview</h4>
+    <p>A mid-size fintech lender deployed an AI-based credit scoring model that used 
+    machine learning to incorporate alternative data sources beyond traditional credit 
+    bureau data. After 18 months in production, analysis revealed significant disparate 
+    impact against minority applicants.</p>
+</div>
+"""
+
+CASE1_BODY_MD = """
+#### 📋 Background
+
+**Company Profile:**
+- Digital lending platform serving underbanked consumers
+- Processing 50,000 loan applications monthly
+- AI model incorporated: social media activity, mobile phone usage patterns, 
+  education history, and employment stability
+
+**Initial Goals:**
+- Expand credit access to thin-file consumers
+- Improve prediction accuracy beyond FICO scores
+- Reduce manual underwriting costs
+
+---
+
+#### ⚠️ What Went Wrong
+
+**Discovery:**
+- Routine fair lending analysis revealed approval rates for minority applicants 
+  were 23% lower than for non-minority applicants with similar credit profiles
+- Investigation found several problematic features:
+"""
+
+CASE1_ANALYSIS_MD = """
+**Root Causes:**
+1. Training data reflected historical lending disparities
+2. Feature selection didn't include bias analysis
+3. No ongoing fairness monitoring
+4. Lack of diverse perspectives in model development team
+5. Pressure to maximize approval rates overrode fairness considerations
+
+---
+
+#### 🔧 Remediation Steps
+
+**Immediate Actions:**
+1. Suspended automated approvals pending review
+2. Notified regulators proactively
+3. Engaged external fair lending experts
+4. Conducted retrospective review of declined applications
+
+**Model Improvements:**
+1. Removed or transformed proxy variables
+2. Implemented adversarial debiasing during training
+3. Added fairness constraints to optimization objective
+4. Introduced mandatory demographic parity thresholds
+
+**Governance Changes:**
+1. Established AI ethics committee with diverse membership
+2. Required pre-deployment fairness testing for all models
+3. Implemented continuous fairness monitoring
+4. Added fair lending expertise to model development team
+
+---
+
+#### ✅ Key Lessons
+"""
+
+CASE1_LESSONS_MD = """- **Alternative data requires extra scrutiny** - Novel data sources can introduce unexpected biases
+- **Fairness testing must be proactive** - Don't wait for complaints or regulatory findings
+- **Diverse teams catch more issues** - Homogeneous teams have blind spots
+- **Business pressure doesn't excuse discrimination** - Fairness requirements are non-negotiable
+- **Continuous monitoring is essential** - Bias can emerge or increase over time"""
+
+CASE1_REGULATORY_MD = """
+---
+
+#### 📜 Regulatory Implications
+"""
+
+CASE2_OVERVIEW_HTML = """
+### Case Study: Customer Service Chatbot Failure
+
+<div class="warning-card">
+    <h4>⚠️ Scenario Overview</h4>
+    <p>A large retail bank deployed an AI-powered chatbot for customer service. 
+    The chatbot provided incorrect information about dispute rights and failed to 
+    recognize when customers were invoking legal protections under Regulation E.</p>
+</div>
+"""
+
+CASE2_BODY_MD = """
+#### 📋 Background
+
+**Deployment Context:**
+- Major retail bank with 10 million customers
+- Chatbot handled 70% of initial customer contacts
+- Designed to reduce call center volume and costs
+- Built on a large language model with custom fine-tuning
+
+**Intended Capabilities:**
+- Answer account balance and transaction questions
+- Process simple service requests
+- Escalate complex issues to human agents
+
+---
+
+#### ⚠️ What Went Wrong
+
+**Incident 1: Incorrect Dispute Rights Information**
+- Customer reported unauthorized transaction
+- Chatbot stated customer was "responsible for all transactions made with their card"
+- Failed to mention Regulation E protections limiting liability to $50 if reported within 2 days
+- Customer delayed reporting, incurring higher losses
+
+**Incident 2: Failed Escalation**
+- Customer explicitly stated "I want to dispute this charge under Regulation E"
+- Chatbot did not recognize the regulatory reference
+- Provided generic information about "checking transaction history"
+- No escalation to human agent triggered
+
+**Incident 3: Hallucinated Policy**
+- Customer asked about fee waiver policy
+- Chatbot confidently stated a fee waiver policy that didn't exist
+- Customer recorded conversation and shared on social media
+- Reputational damage and regulatory inquiry followed
+
+**Root Causes:**
+1. LLM not properly fine-tuned on regulatory requirements
+2. Trigger phrases for escalation were too narrow
+3. No content validation against actual bank policies
+4. Insufficient testing with adversarial scenarios
+5. No human review of chatbot training data
+
+---
+
+#### 🔧 Remediation Steps
+
+**Immediate Actions:**
+1. Added prominent "Speak to Human Agent" option
+2. Disabled responses to dispute-related queries
+3. Notified affected customers of correct dispute rights
+4. Engaged CFPB and state regulators proactively
+
+**Technical Improvements:**
+1. Implemented retrieval-augmented generation (RAG) with policy database
+2. Added rule-based triggers for regulatory terms
+3. Implemented confidence scoring with human handoff below threshold
+4. Created "red team" testing program for adversarial prompts
+
+**Governance Changes:**
+1. Required legal/compliance review of all chatbot responses
+2. Implemented continuous monitoring of customer satisfaction
+3. Created escalation metrics and accountability
+4. Added regular compliance audits of chatbot performance
+
+---
+
+#### ✅ Key Lessons
+"""
+
+CASE2_LESSONS_MD = """- **Regulatory content requires special handling** - LLMs can hallucinate or misstate legal requirements
+- **Escalation triggers must be comprehensive** - Customers use varied language to invoke rights
+- **Confidence thresholds matter** - Low-confidence responses should go to humans
+- **Continuous monitoring is critical** - Issues may only emerge with diverse user interactions
+- **Chatbots cannot replace required disclosures** - Legal notices must be accurate and complete"""
+
+CASE2_CFPB_MD = """
+---
+
+#### 📜 CFPB Guidance Implications
+
+The CFPB has issued specific guidance on chatbots in consumer finance:
+
+1. **Chatbots cannot replace human interaction** when consumers need substantive help
+2. **Inaccurate information may constitute a UDAAP** (Unfair, Deceptive, or Abusive Act or Practice)
+3. **Must recognize when consumers invoke statutory rights** under Reg E, Reg Z, etc.
+4. **Data privacy and security risks** must be addressed
+5. **Institutions remain responsible** for third-party AI providers
+"""
+
+CASE3_OVERVIEW_HTML = """
+### Case Study: AI Trading System Malfunction
+
+<div class="warning-card">
+    <h4>⚠️ Scenario Overview</h4>
+    <p>An asset management firm's AI-powered trading system made a series of 
+    erratic trades during a period of market volatility, resulting in significant 
+    client losses and regulatory scrutiny.</p>
+</div>
+"""
+
+CASE3_BODY_MD = """
+#### 📋 Background
+
+**System Profile:**
+- Quantitative hedge fund using reinforcement learning for trade execution
+- Managing $2.5 billion in client assets
+- AI system made 85% of trading decisions
+- Trained on 10 years of market data
+
+**Design Intent:**
+- Optimize execution to minimize market impact
+- Identify short-term alpha opportunities
+- Manage portfolio risk in real-time
+
+---
+
+#### ⚠️ What Went Wrong
+
+**The Incident:**
+- During an unexpected geopolitical event, markets experienced unusual volatility
+- AI system encountered patterns not present in training data
+- System interpreted volatility as alpha opportunity rather than risk
+- Executed a series of leveraged positions that amplified losses
+- Human oversight failed due to speed of execution
+
+**Sequence of Events:**
+"""
+
+CASE3_ANALYSIS_MD = """
+**Root Causes:**
+1. Training data didn't include similar volatility regime
+2. Risk limits were based on historical VaR, not stressed scenarios
+3. Human override was too slow to prevent damage
+4. Lack of circuit breakers for unusual behavior
+5. Overconfidence in AI system after years of success
+
+---
+
+#### 🔧 Remediation Steps
+
+**Immediate Actions:**
+1. Suspended AI trading pending review
+2. Notified SEC and clients
+3. Engaged independent auditors
+4. Implemented immediate position limits
+
+**System Improvements:**
+1. Added real-time anomaly detection for AI behavior
+2. Implemented regime detection to identify unusual markets
+3. Created hard limits on position size and velocity
+4. Added "uncertainty estimation" to model outputs
+
+**Governance Changes:**
+1. Established AI oversight committee with market risk expertise
+2. Required stress testing under extreme scenarios
+3. Implemented mandatory human approval above thresholds
+4. Created quarterly model review process
+
+---
+
+#### ✅ Key Lessons
+"""
+
+CASE3_LESSONS_MD = """- **Historical data has limits** - AI systems can fail in unprecedented conditions
+- **Speed requires automated safeguards** - Human oversight can't match AI execution speed
+- **Uncertainty estimation is crucial** - Models should know what they don't know
+- **Stress testing must go beyond history** - Include hypothetical extreme scenarios
+- **Success breeds complacency** - Past performance doesn't guarantee future safety"""
+
+SCENARIO_BRIEF_MD = """
+### 🎯 Interactive Scenario: AI Credit Decision Review
+
+You are the Chief Risk Officer at a digital lender. Your AI credit scoring team 
+has proposed a new model enhancement. Review the proposal and make a decision.
+
+---
+
+#### 📋 Proposal Summary
+
+**Enhancement:** Incorporate social media sentiment analysis into credit scoring
+
+**Claimed Benefits:**
+- 15% improvement in default prediction accuracy
+- Ability to score thin-file applicants
+- Real-time updates to credit assessments
+
+**Data Sources:**
+- Public social media posts
+- Sentiment analysis of text content
+- Network analysis of connections
+- Activity patterns and engagement metrics
+"""
+
+SCENARIO_EXPERT_MD = """
+---
+
+#### 💡 Expert Analysis
+
+**Recommended Approach:** Conditional approval with comprehensive safeguards
+
+Social media data in credit scoring presents significant risks but may be viable with:
+
+1. **Robust bias testing** - Demographic analysis across all protected classes
+2. **Explainability** - Clear mapping from social signals to credit factors
+3. **Consent** - Transparent disclosure and opt-in mechanisms
+4. **Monitoring** - Ongoing fairness metrics with automatic alerts
+5. **Human oversight** - Review process for declined applications
+6. **Regulatory engagement** - Proactive consultation with CFPB, state regulators
+
+**Key Risk:** Many social media signals correlate with protected characteristics, 
+making discrimination difficult to prevent even with careful design.
+"""
+
+RESOURCES_INTRO_HTML = """
+<h1 class="main-header">📚 Resources & Documentation</h1>
+<div class="info-card">
+    <p>Access comprehensive resources, official documentation, and learning materials 
+    for AI ethics and governance in financial services.</p>
+</div>
+"""
+
+RESOURCES_REGULATIONS_MD = """
+### Official Regulatory Documents
+
+#### 🇪🇺 European Union
+
+| Document | Description | Link |
+|----------|-------------|------|
+| EU AI Act (Regulation 2024/1689) | Comprehensive AI regulation | [EUR-Lex](https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=CELEX:32024R1689) |
+| GDPR (Regulation 2016/679) | Data protection framework | [EUR-Lex](https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=CELEX:32016R0679) |
+| AI Office Guidelines | Implementation guidance | [EC Digital Strategy](https://digital-strategy.ec.europa.eu/en/policies/regulatory-framework-ai) |
+
+---
+
+#### 🇺🇸 United States
+
+| Document | Description | Link |
+|----------|-------------|------|
+| NIST AI RMF 1.0 | AI Risk Management Framework | [NIST](https://www.nist.gov/itl/ai-risk-management-framework) |
+| NIST AI RMF Playbook | Implementation guidance | [NIST Playbook](https://airc.nist.gov/airmf-resources/airmf/) |
+| NIST GenAI Profile | Generative AI guidance | [NIST AI-600-1](https://nvlpubs.nist.gov/nistpubs/ai/NIST.AI.600-1.pdf) |
+| SR 11-7 | Model Risk Management | [Federal Reserve](https://www.federalreserve.gov/supervisionreg/srletters/sr1107.htm) |
+| CFPB AI Guidance | Consumer protection in AI | [CFPB](https://www.consumerfinance.gov/rules-policy/advanced-technology/) |
+| ECOA | Equal Credit Opportunity Act | [Consumer Finance](https://www.consumerfinance.gov/rules-policy/regulations/1002/) |
+
+---
+
+#### 🇬🇧 United Kingdom
+
+| Document | Description | Link |
+|----------|-------------|------|
+| FCA AI Update (2024) | FCA approach to AI | [FCA](https://www.fca.org.uk/publication/corporate/ai-update.pdf) |
+| FCA Consumer Duty | Customer outcomes focus | [FCA Consumer Duty](https://www.fca.org.uk/firms/consumer-duty) |
+| AI Survey 2024 | AI usage in UK FS | [Bank of England](https://www.bankofengland.co.uk/report/2024/artificial-intelligence-in-uk-financial-services-2024) |
+| UK Government AI Framework | 5 principles approach | [GOV.UK](https://www.gov.uk/government/publications/ai-regulation-a-pro-innovation-approach) |
+
+---
+
+#### 🇸🇬 Singapore
+
+| Document | Description | Link |
+|----------|-------------|------|
+| FEAT Principles | Fairness, Ethics, Accountability, Transparency | [MAS](https://www.mas.gov.sg/publications/monographs-or-information-paper/2018/feat) |
+| Veritas Toolkit | FEAT implementation tools | [GitHub](https://github.com/veritas-toolkit/) |
+| MindForge GenAI Whitepaper | GenAI in financial services | [MAS](https://www.mas.gov.sg/schemes-and-initiatives/project-mindforge) |
+"""
+
+RESOURCES_FRAMEWORKS_MD = """
+### Frameworks & Industry Guidelines
+
+#### 🌐 International Standards
+
+- **OECD AI Principles** - International framework for trustworthy AI
+- **ISO/IEC 42001** - AI Management System standard
+- **IEEE 7000 Series** - Ethical considerations in system design
+
+#### 🏦 Financial Services Specific
+
+- **BIS/FSB** - Financial Stability Board AI guidance
+- **IOSCO** - AI in capital markets guidance
+- **IAIS** - Insurance sector AI principles
+
+#### 🔬 Technical Standards
+
+- **NIST SP 800-53** - Security controls (applicable to AI systems)
+- **ISO 27001** - Information security management
+- **SOC 2** - Service organization controls
+
+#### 🎯 Industry Best Practices
+"""
+
+RESOURCES_LEARNING_MD = """
+### Learning Resources
+
+#### 📚 Recommended Reading
+
+**Books:**
+- "Weapons of Math Destruction" - Cathy O'Neil
+- "Algorithms of Oppression" - Safiya Noble
+- "The Alignment Problem" - Brian Christian
+- "Artificial Intelligence: A Guide for Thinking Humans" - Melanie Mitchell
+
+**Academic Papers:**
+- "Fairness and Machine Learning" - Barocas, Hardt, Narayanan
+- "Algorithmic Discrimination in Credit Domain" - Springer AI & Society
+- "Explainable AI in Financial Services" - Various authors
+
+#### 🎓 Online Courses
+"""
+
+RESOURCES_VIDEO_MD = """
+#### 🎥 Video Resources
+
+- NIST AI RMF Explainer Video
+- FCA AI Lab Webinars
+- MAS FinTech Festival Sessions
+- CFPB Consumer Protection Webinars
+
+#### 🎪 Conferences & Events
+
+- Singapore FinTech Festival
+- Money 20/20
+- AI & Big Data Expo
+- RegTech Summit
+"""
+
+RESOURCES_TOOLS_MD = """
+### Tools & Templates
+
+#### 🔧 Assessment Tools
+"""
+
+RESOURCES_TEMPLATES_MD = """
+#### 📋 Templates
+
+This toolkit provides the following templates (available in Export section):
+
+- **AI Risk Assessment Template** - Comprehensive risk identification
+- **Governance Framework Template** - Organizational structure and policies
+- **Ethical Assessment Checklist** - Pre-deployment review
+- **Incident Response Template** - AI failure handling
+- **Regulatory Mapping Template** - Compliance tracking
+
+#### 🖥️ Technical Resources
+
+**Explainability Libraries:**
+- SHAP (SHapley Additive exPlanations)
+- LIME (Local Interpretable Model-agnostic Explanations)
+- Alibi
+- Captum (PyTorch)
+
+**Fairness Libraries:**
+- Fairlearn (Microsoft)
+- AI Fairness 360 (IBM)
+- Aequitas
+- Themis-ML
+
+**Model Monitoring:**
+- Evidently AI
+- Fiddler AI
+- Arize AI
+- WhyLabs
+"""
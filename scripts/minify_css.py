@@ -0,0 +1,34 @@
+"""Regenerate static/style.min.css from static/style.css.
+
+Run after editing the stylesheet:
+
+    python scripts/minify_css.py
+
+The app ships the minified copy because the style block travels over the
+Streamlit websocket on every rerun; stripping comments and whitespace
+roughly halves those bytes. Plain stdlib so there is no build dependency.
+"""
+
+import re
+from pathlib import Path
+
+STATIC = Path(__file__).resolve().parent.parent / "static"
+
+
+def minify(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+def main() -> None:
+    source = (STATIC / "style.css").read_text()
+    minified = minify(source)
+    (STATIC / "style.min.css").write_text(minified)
+    print(f"style.min.css: {len(source)} -> {len(minified)} bytes")
+
+
+if __name__ == "__main__":
+    main()